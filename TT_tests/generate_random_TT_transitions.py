@@ -1,4 +1,5 @@
 import random
+import sys
 
 BLANK = 0
 ACCEPT_STATE = "accept"
@@ -11,8 +12,20 @@ S = "S"
 STATES = set((f"state{no}" for no in range(7))) | {ACCEPT_STATE, REJECT_STATE, START_STATE}
 ALPHABET = {BLANK, 1, 2}
 DIRS = {R, L, S}
+TRANSITIONS = 10000
+BATCH = 2000
+
+states = sorted(STATES)
+alphabet = sorted(ALPHABET)
+dirs = sorted(DIRS)
 transitions = set()
-while len(transitions) < 10000:
-    transitions |= {(random.sample(STATES, 1)[0], random.sample(ALPHABET, 1)[0], random.sample(ALPHABET, 1)[0], random.sample(STATES, 1)[0], random.sample(ALPHABET, 1)[0], random.sample(ALPHABET, 1)[0], random.sample(DIRS, 1)[0], random.sample(DIRS, 1)[0])}
-for (st, l1, l2, tst, tl1, tl2, dir1, dir2) in transitions:
-    print(f"{st} {l1} {l2} {tst} {tl1} {tl2} {dir1} {dir2}")
\ No newline at end of file
+while len(transitions) < TRANSITIONS:
+    batch = zip(random.choices(states, k=BATCH), random.choices(alphabet, k=BATCH), random.choices(alphabet, k=BATCH),
+                random.choices(states, k=BATCH), random.choices(alphabet, k=BATCH), random.choices(alphabet, k=BATCH),
+                random.choices(dirs, k=BATCH), random.choices(dirs, k=BATCH))
+    for transition in batch:
+        transitions.add(transition)
+        if len(transitions) == TRANSITIONS:
+            break
+sys.stdout.write("\n".join(f"{st} {l1} {l2} {tst} {tl1} {tl2} {dir1} {dir2}"
+                           for (st, l1, l2, tst, tl1, tl2, dir1, dir2) in transitions) + "\n")
\ No newline at end of file
@@ -1,1922 +1,55 @@
-start 0 initializeFirstTape 3 R
-start 1 initializeFirstTape 4 R
-start 2 initializeFirstTape 5 R
+start 0 initializeFirstTape 2 R
+start 1 initializeFirstTape 3 R
 initializeFirstTape 1 initializeFirstTape 1 R
-initializeFirstTape 2 initializeFirstTape 2 R
-initializeFirstTape 0 initializeSecondTapeBlank 12 R
-initializeSecondTapeBlank 0 initializeSecondTapeSeparator 6 R
-initializeSecondTapeSeparator 0 goBackToFirstHeadOnSecondTape|org_state:start 12 L
-goBackToFirstHeadOnSecondTape|org_state:accept 0 goBackToFirstHeadOnSecondTape|org_state:accept 0 L
-goBackToFirstHeadOnSecondTape|org_state:intState 0 goBackToFirstHeadOnSecondTape|org_state:intState 0 L
-goBackToFirstHeadOnSecondTape|org_state:reject 0 goBackToFirstHeadOnSecondTape|org_state:reject 0 L
-goBackToFirstHeadOnSecondTape|org_state:start 0 goBackToFirstHeadOnSecondTape|org_state:start 0 L
-goBackToFirstHeadOnSecondTape|org_state:accept 1 goBackToFirstHeadOnSecondTape|org_state:accept 1 L
-goBackToFirstHeadOnSecondTape|org_state:intState 1 goBackToFirstHeadOnSecondTape|org_state:intState 1 L
-goBackToFirstHeadOnSecondTape|org_state:reject 1 goBackToFirstHeadOnSecondTape|org_state:reject 1 L
-goBackToFirstHeadOnSecondTape|org_state:start 1 goBackToFirstHeadOnSecondTape|org_state:start 1 L
-goBackToFirstHeadOnSecondTape|org_state:accept 2 goBackToFirstHeadOnSecondTape|org_state:accept 2 L
-goBackToFirstHeadOnSecondTape|org_state:intState 2 goBackToFirstHeadOnSecondTape|org_state:intState 2 L
-goBackToFirstHeadOnSecondTape|org_state:reject 2 goBackToFirstHeadOnSecondTape|org_state:reject 2 L
-goBackToFirstHeadOnSecondTape|org_state:start 2 goBackToFirstHeadOnSecondTape|org_state:start 2 L
-goBackToFirstHeadOnSecondTape|org_state:accept 6 goBackToFirstHeadOnSecondTape|org_state:accept 6 L
-goBackToFirstHeadOnSecondTape|org_state:intState 6 goBackToFirstHeadOnSecondTape|org_state:intState 6 L
-goBackToFirstHeadOnSecondTape|org_state:reject 6 goBackToFirstHeadOnSecondTape|org_state:reject 6 L
-goBackToFirstHeadOnSecondTape|org_state:start 6 goBackToFirstHeadOnSecondTape|org_state:start 6 L
-goBackToFirstHeadOnSecondTape|org_state:accept 7 goBackToFirstHeadOnSecondTape|org_state:accept 7 L
-goBackToFirstHeadOnSecondTape|org_state:intState 7 goBackToFirstHeadOnSecondTape|org_state:intState 7 L
-goBackToFirstHeadOnSecondTape|org_state:reject 7 goBackToFirstHeadOnSecondTape|org_state:reject 7 L
-goBackToFirstHeadOnSecondTape|org_state:start 7 goBackToFirstHeadOnSecondTape|org_state:start 7 L
-goBackToFirstHeadOnSecondTape|org_state:accept 8 goBackToFirstHeadOnSecondTape|org_state:accept 8 L
-goBackToFirstHeadOnSecondTape|org_state:intState 8 goBackToFirstHeadOnSecondTape|org_state:intState 8 L
-goBackToFirstHeadOnSecondTape|org_state:reject 8 goBackToFirstHeadOnSecondTape|org_state:reject 8 L
-goBackToFirstHeadOnSecondTape|org_state:start 8 goBackToFirstHeadOnSecondTape|org_state:start 8 L
-goBackToFirstHeadOnSecondTape|org_state:accept 12 goBackToFirstHeadOnFirstTape|org_state:accept 12 L
-goBackToFirstHeadOnSecondTape|org_state:intState 12 goBackToFirstHeadOnFirstTape|org_state:intState 12 L
-goBackToFirstHeadOnSecondTape|org_state:reject 12 goBackToFirstHeadOnFirstTape|org_state:reject 12 L
-goBackToFirstHeadOnSecondTape|org_state:start 12 goBackToFirstHeadOnFirstTape|org_state:start 12 L
-goBackToFirstHeadOnFirstTape|org_state:accept 0 goBackToFirstHeadOnFirstTape|org_state:accept 0 L
-goBackToFirstHeadOnFirstTape|org_state:intState 0 goBackToFirstHeadOnFirstTape|org_state:intState 0 L
-goBackToFirstHeadOnFirstTape|org_state:reject 0 goBackToFirstHeadOnFirstTape|org_state:reject 0 L
-goBackToFirstHeadOnFirstTape|org_state:start 0 goBackToFirstHeadOnFirstTape|org_state:start 0 L
-goBackToFirstHeadOnFirstTape|org_state:accept 1 goBackToFirstHeadOnFirstTape|org_state:accept 1 L
-goBackToFirstHeadOnFirstTape|org_state:intState 1 goBackToFirstHeadOnFirstTape|org_state:intState 1 L
-goBackToFirstHeadOnFirstTape|org_state:reject 1 goBackToFirstHeadOnFirstTape|org_state:reject 1 L
-goBackToFirstHeadOnFirstTape|org_state:start 1 goBackToFirstHeadOnFirstTape|org_state:start 1 L
-goBackToFirstHeadOnFirstTape|org_state:accept 2 goBackToFirstHeadOnFirstTape|org_state:accept 2 L
-goBackToFirstHeadOnFirstTape|org_state:intState 2 goBackToFirstHeadOnFirstTape|org_state:intState 2 L
-goBackToFirstHeadOnFirstTape|org_state:reject 2 goBackToFirstHeadOnFirstTape|org_state:reject 2 L
-goBackToFirstHeadOnFirstTape|org_state:start 2 goBackToFirstHeadOnFirstTape|org_state:start 2 L
-goBackToFirstHeadOnFirstTape|org_state:accept 3 ReadLet2|org_state:accept|let1:0 3 R
-goBackToFirstHeadOnFirstTape|org_state:intState 3 ReadLet2|org_state:intState|let1:0 3 R
-goBackToFirstHeadOnFirstTape|org_state:reject 3 ReadLet2|org_state:reject|let1:0 3 R
-goBackToFirstHeadOnFirstTape|org_state:start 3 ReadLet2|org_state:start|let1:0 3 R
-goBackToFirstHeadOnFirstTape|org_state:accept 4 ReadLet2|org_state:accept|let1:1 4 R
-goBackToFirstHeadOnFirstTape|org_state:intState 4 ReadLet2|org_state:intState|let1:1 4 R
-goBackToFirstHeadOnFirstTape|org_state:reject 4 ReadLet2|org_state:reject|let1:1 4 R
-goBackToFirstHeadOnFirstTape|org_state:start 4 ReadLet2|org_state:start|let1:1 4 R
-goBackToFirstHeadOnFirstTape|org_state:accept 5 ReadLet2|org_state:accept|let1:2 5 R
-goBackToFirstHeadOnFirstTape|org_state:intState 5 ReadLet2|org_state:intState|let1:2 5 R
-goBackToFirstHeadOnFirstTape|org_state:reject 5 ReadLet2|org_state:reject|let1:2 5 R
-goBackToFirstHeadOnFirstTape|org_state:start 5 ReadLet2|org_state:start|let1:2 5 R
-ReadLet2|org_state:accept|let1:0 0 ReadLet2|org_state:accept|let1:0 0 R
-ReadLet2|org_state:intState|let1:0 0 ReadLet2|org_state:intState|let1:0 0 R
-ReadLet2|org_state:reject|let1:0 0 ReadLet2|org_state:reject|let1:0 0 R
+initializeFirstTape 0 initializeSecondTapeBlank 8 R
+initializeSecondTapeBlank 0 initializeSecondTapeSeparator 4 R
+initializeSecondTapeSeparator 0 goBackToFirstHeadOnSecondTape 8 L
+goBackToFirstHeadOnSecondTape 0 goBackToFirstHeadOnSecondTape 0 L
+goBackToFirstHeadOnSecondTape 1 goBackToFirstHeadOnSecondTape 1 L
+goBackToFirstHeadOnSecondTape 4 goBackToFirstHeadOnSecondTape 4 L
+goBackToFirstHeadOnSecondTape 5 goBackToFirstHeadOnSecondTape 5 L
+goBackToFirstHeadOnSecondTape 8 goBackToFirstHeadOnFirstTape 8 L
+goBackToFirstHeadOnFirstTape 0 goBackToFirstHeadOnFirstTape 0 L
+goBackToFirstHeadOnFirstTape 1 goBackToFirstHeadOnFirstTape 1 L
+goBackToFirstHeadOnFirstTape 2 ReadLet2|org_state:start|let1:0 2 R
 ReadLet2|org_state:start|let1:0 0 ReadLet2|org_state:start|let1:0 0 R
-ReadLet2|org_state:accept|let1:1 0 ReadLet2|org_state:accept|let1:1 0 R
-ReadLet2|org_state:intState|let1:1 0 ReadLet2|org_state:intState|let1:1 0 R
-ReadLet2|org_state:reject|let1:1 0 ReadLet2|org_state:reject|let1:1 0 R
-ReadLet2|org_state:start|let1:1 0 ReadLet2|org_state:start|let1:1 0 R
-ReadLet2|org_state:accept|let1:2 0 ReadLet2|org_state:accept|let1:2 0 R
-ReadLet2|org_state:intState|let1:2 0 ReadLet2|org_state:intState|let1:2 0 R
-ReadLet2|org_state:reject|let1:2 0 ReadLet2|org_state:reject|let1:2 0 R
-ReadLet2|org_state:start|let1:2 0 ReadLet2|org_state:start|let1:2 0 R
-ReadLet2|org_state:accept|let1:0 1 ReadLet2|org_state:accept|let1:0 1 R
-ReadLet2|org_state:intState|let1:0 1 ReadLet2|org_state:intState|let1:0 1 R
-ReadLet2|org_state:reject|let1:0 1 ReadLet2|org_state:reject|let1:0 1 R
 ReadLet2|org_state:start|let1:0 1 ReadLet2|org_state:start|let1:0 1 R
-ReadLet2|org_state:accept|let1:1 1 ReadLet2|org_state:accept|let1:1 1 R
+ReadLet2|org_state:start|let1:0 8 ReadLet2|org_state:start|let1:0 8 R
+ReadLet2|org_state:intState|let1:1 0 ReadLet2|org_state:intState|let1:1 0 R
 ReadLet2|org_state:intState|let1:1 1 ReadLet2|org_state:intState|let1:1 1 R
-ReadLet2|org_state:reject|let1:1 1 ReadLet2|org_state:reject|let1:1 1 R
-ReadLet2|org_state:start|let1:1 1 ReadLet2|org_state:start|let1:1 1 R
-ReadLet2|org_state:accept|let1:2 1 ReadLet2|org_state:accept|let1:2 1 R
-ReadLet2|org_state:intState|let1:2 1 ReadLet2|org_state:intState|let1:2 1 R
-ReadLet2|org_state:reject|let1:2 1 ReadLet2|org_state:reject|let1:2 1 R
-ReadLet2|org_state:start|let1:2 1 ReadLet2|org_state:start|let1:2 1 R
-ReadLet2|org_state:accept|let1:0 2 ReadLet2|org_state:accept|let1:0 2 R
-ReadLet2|org_state:intState|let1:0 2 ReadLet2|org_state:intState|let1:0 2 R
-ReadLet2|org_state:reject|let1:0 2 ReadLet2|org_state:reject|let1:0 2 R
-ReadLet2|org_state:start|let1:0 2 ReadLet2|org_state:start|let1:0 2 R
-ReadLet2|org_state:accept|let1:1 2 ReadLet2|org_state:accept|let1:1 2 R
-ReadLet2|org_state:intState|let1:1 2 ReadLet2|org_state:intState|let1:1 2 R
-ReadLet2|org_state:reject|let1:1 2 ReadLet2|org_state:reject|let1:1 2 R
-ReadLet2|org_state:start|let1:1 2 ReadLet2|org_state:start|let1:1 2 R
-ReadLet2|org_state:accept|let1:2 2 ReadLet2|org_state:accept|let1:2 2 R
-ReadLet2|org_state:intState|let1:2 2 ReadLet2|org_state:intState|let1:2 2 R
-ReadLet2|org_state:reject|let1:2 2 ReadLet2|org_state:reject|let1:2 2 R
-ReadLet2|org_state:start|let1:2 2 ReadLet2|org_state:start|let1:2 2 R
-ReadLet2|org_state:accept|let1:0 12 ReadLet2|org_state:accept|let1:0 12 R
-ReadLet2|org_state:intState|let1:0 12 ReadLet2|org_state:intState|let1:0 12 R
-ReadLet2|org_state:reject|let1:0 12 ReadLet2|org_state:reject|let1:0 12 R
-ReadLet2|org_state:start|let1:0 12 ReadLet2|org_state:start|let1:0 12 R
-ReadLet2|org_state:accept|let1:1 12 ReadLet2|org_state:accept|let1:1 12 R
-ReadLet2|org_state:intState|let1:1 12 ReadLet2|org_state:intState|let1:1 12 R
-ReadLet2|org_state:reject|let1:1 12 ReadLet2|org_state:reject|let1:1 12 R
-ReadLet2|org_state:start|let1:1 12 ReadLet2|org_state:start|let1:1 12 R
-ReadLet2|org_state:accept|let1:2 12 ReadLet2|org_state:accept|let1:2 12 R
-ReadLet2|org_state:intState|let1:2 12 ReadLet2|org_state:intState|let1:2 12 R
-ReadLet2|org_state:reject|let1:2 12 ReadLet2|org_state:reject|let1:2 12 R
-ReadLet2|org_state:start|let1:2 12 ReadLet2|org_state:start|let1:2 12 R
-ReadLet2|org_state:intState|let1:1 6 executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 6 S
-ReadLet2|org_state:start|let1:0 6 executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 6 S
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:R 6 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:R 7 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 R
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 R
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:R 8 executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:R 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:L 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:S 6 R
-executeSecondHeadActionRightCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 12 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:S 6 R
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:R 0 goToFirstHead|org_state:accept|tlet1:0|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:R 0 goToFirstHead|org_state:intState|tlet1:0|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:R 0 goToFirstHead|org_state:reject|tlet1:0|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:R 0 goToFirstHead|org_state:start|tlet1:0|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:L 0 goToFirstHead|org_state:accept|tlet1:0|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:L 0 goToFirstHead|org_state:intState|tlet1:0|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:L 0 goToFirstHead|org_state:reject|tlet1:0|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:L 0 goToFirstHead|org_state:start|tlet1:0|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:0|dir1:S 0 goToFirstHead|org_state:intState|tlet1:0|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:0|dir1:S 0 goToFirstHead|org_state:reject|tlet1:0|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:0|dir1:S 0 goToFirstHead|org_state:start|tlet1:0|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:R 0 goToFirstHead|org_state:accept|tlet1:1|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:R 0 goToFirstHead|org_state:intState|tlet1:1|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:R 0 goToFirstHead|org_state:reject|tlet1:1|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:R 0 goToFirstHead|org_state:start|tlet1:1|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:L 0 goToFirstHead|org_state:accept|tlet1:1|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:L 0 goToFirstHead|org_state:intState|tlet1:1|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:L 0 goToFirstHead|org_state:reject|tlet1:1|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:L 0 goToFirstHead|org_state:start|tlet1:1|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:1|dir1:S 0 goToFirstHead|org_state:accept|tlet1:1|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:1|dir1:S 0 goToFirstHead|org_state:reject|tlet1:1|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:1|dir1:S 0 goToFirstHead|org_state:start|tlet1:1|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:R 0 goToFirstHead|org_state:accept|tlet1:2|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:R 0 goToFirstHead|org_state:intState|tlet1:2|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:R 0 goToFirstHead|org_state:reject|tlet1:2|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:R 0 goToFirstHead|org_state:start|tlet1:2|dir1:R 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:L 0 goToFirstHead|org_state:accept|tlet1:2|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:L 0 goToFirstHead|org_state:intState|tlet1:2|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:L 0 goToFirstHead|org_state:reject|tlet1:2|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:L 0 goToFirstHead|org_state:start|tlet1:2|dir1:L 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:2|dir1:S 0 goToFirstHead|org_state:accept|tlet1:2|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:2|dir1:S 0 goToFirstHead|org_state:intState|tlet1:2|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:reject|tlet1:2|dir1:S 0 goToFirstHead|org_state:reject|tlet1:2|dir1:S 12 L
-executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:start|tlet1:2|dir1:S 0 goToFirstHead|org_state:start|tlet1:2|dir1:S 12 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:0|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:0|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:0|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:1|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:1|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:1|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:0|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:1|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:L 8 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:L 6 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:R|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:L|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 L
-executeSecondHeadAction|org_state:accept|tlet1:2|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:intState|tlet1:2|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:reject|tlet1:2|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 L
-executeSecondHeadAction|org_state:start|tlet1:2|tlet2:2|dir1:S|dir2:L 7 executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 0 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 0 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 0 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 0 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 0 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 0 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 0 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 0 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 0 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 0 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 0 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 1 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 1 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 1 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 1 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 1 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 1 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 1 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 1 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 1 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 1 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 1 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 2 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 2 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 2 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 2 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 2 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 2 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 2 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 2 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 2 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 2 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 2 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 2 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 0 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 0 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 0 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 0 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 0 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 0 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 0 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 0 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 0 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 0 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 0 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 1 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 1 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 1 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 1 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 1 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 1 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 1 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 1 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 1 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 1 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 1 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 2 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 2 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 2 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 2 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 2 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 2 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 2 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 2 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 2 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 2 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 2 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 2 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 0 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 0 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 0 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 0 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 0 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 0 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 0 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 0 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 0 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 0 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 0 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 0 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 1 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 1 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 1 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 1 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 1 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 1 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 1 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 1 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 1 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 1 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 1 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 1 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 2 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 2 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 2 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 2 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 2 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 2 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 2 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 2 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 2 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 2 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 2 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 2 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:0|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:0|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:0|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:1|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:1|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:1|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:R 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:R 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:L 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:L 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:accept|tlet1:2|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:intState|tlet1:2|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:reject|tlet1:2|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:S 12 R
-executeSecondHeadActionLeftCheckIfExceedsTape|org_state:start|tlet1:2|dir1:S 12 executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:S 12 R
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:R 0 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:R 0 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:R 0 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:R 0 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:R 1 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:R 1 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:R 1 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:R 1 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:R 2 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:R 2 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:R 2 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:R 2 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:L 0 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:L 0 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:L 0 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:L 0 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:L 1 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:L 1 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:L 1 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:L 1 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:L 2 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:L 2 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:L 2 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:L 2 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:S 0 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:S 0 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:S 0 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:S 1 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:S 1 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:S 1 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:S 1 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:0|dir1:S 2 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:0|dir1:S 2 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:0|dir1:S 2 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:0|dir1:S 2 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:R 0 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:R 0 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:R 0 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:R 0 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:R 1 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:R 1 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:R 1 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:R 1 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:R 2 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:R 2 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:R 2 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:R 2 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:L 0 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:L 0 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:L 0 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:L 0 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:L 1 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:L 1 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:L 1 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:L 1 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:L 2 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:L 2 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:L 2 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:L 2 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:S 0 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:S 0 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:S 0 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:S 1 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:S 1 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:S 1 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:S 1 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:1|dir1:S 2 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:1|dir1:S 2 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:1|dir1:S 2 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:1|dir1:S 2 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:R 0 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:R 0 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:R 0 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:R 0 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:R 1 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:R 1 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:R 1 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:R 1 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:R 2 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:R 2 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:R 2 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:R 2 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:L 0 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:L 0 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:L 0 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:L 0 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:L 1 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:L 1 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:L 1 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:L 1 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:L 2 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:L 2 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:L 2 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:L 2 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:S 0 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:S 0 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:S 0 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:S 0 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:S 1 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:S 1 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:S 1 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:S 1 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:accept|tlet1:2|dir1:S 2 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:intState|tlet1:2|dir1:S 2 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:reject|tlet1:2|dir1:S 2 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline|org_state:start|tlet1:2|dir1:S 2 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 0 goToFirstHead|org_state:accept|tlet1:0|dir1:R 0 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 0 goToFirstHead|org_state:intState|tlet1:0|dir1:R 0 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 0 goToFirstHead|org_state:reject|tlet1:0|dir1:R 0 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 0 goToFirstHead|org_state:start|tlet1:0|dir1:R 0 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 1 goToFirstHead|org_state:accept|tlet1:0|dir1:R 1 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 1 goToFirstHead|org_state:intState|tlet1:0|dir1:R 1 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 1 goToFirstHead|org_state:reject|tlet1:0|dir1:R 1 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 1 goToFirstHead|org_state:start|tlet1:0|dir1:R 1 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 2 goToFirstHead|org_state:accept|tlet1:0|dir1:R 2 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 2 goToFirstHead|org_state:intState|tlet1:0|dir1:R 2 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 2 goToFirstHead|org_state:reject|tlet1:0|dir1:R 2 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 2 goToFirstHead|org_state:start|tlet1:0|dir1:R 2 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 goToFirstHead|org_state:accept|tlet1:0|dir1:R 6 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 goToFirstHead|org_state:intState|tlet1:0|dir1:R 6 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 goToFirstHead|org_state:reject|tlet1:0|dir1:R 6 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 6 goToFirstHead|org_state:start|tlet1:0|dir1:R 6 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 goToFirstHead|org_state:accept|tlet1:0|dir1:R 7 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 goToFirstHead|org_state:intState|tlet1:0|dir1:R 7 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 goToFirstHead|org_state:reject|tlet1:0|dir1:R 7 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 7 goToFirstHead|org_state:start|tlet1:0|dir1:R 7 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 goToFirstHead|org_state:accept|tlet1:0|dir1:R 8 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 goToFirstHead|org_state:intState|tlet1:0|dir1:R 8 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 goToFirstHead|org_state:reject|tlet1:0|dir1:R 8 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 8 goToFirstHead|org_state:start|tlet1:0|dir1:R 8 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 12 goToFirstHead|org_state:accept|tlet1:0|dir1:R 12 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 12 goToFirstHead|org_state:intState|tlet1:0|dir1:R 12 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 12 goToFirstHead|org_state:reject|tlet1:0|dir1:R 12 L
-goToFirstHead|org_state:start|tlet1:0|dir1:R 12 goToFirstHead|org_state:start|tlet1:0|dir1:R 12 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 0 goToFirstHead|org_state:accept|tlet1:0|dir1:L 0 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 0 goToFirstHead|org_state:intState|tlet1:0|dir1:L 0 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 0 goToFirstHead|org_state:reject|tlet1:0|dir1:L 0 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 0 goToFirstHead|org_state:start|tlet1:0|dir1:L 0 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 1 goToFirstHead|org_state:accept|tlet1:0|dir1:L 1 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 1 goToFirstHead|org_state:intState|tlet1:0|dir1:L 1 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 1 goToFirstHead|org_state:reject|tlet1:0|dir1:L 1 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 1 goToFirstHead|org_state:start|tlet1:0|dir1:L 1 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 2 goToFirstHead|org_state:accept|tlet1:0|dir1:L 2 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 2 goToFirstHead|org_state:intState|tlet1:0|dir1:L 2 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 2 goToFirstHead|org_state:reject|tlet1:0|dir1:L 2 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 2 goToFirstHead|org_state:start|tlet1:0|dir1:L 2 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 goToFirstHead|org_state:accept|tlet1:0|dir1:L 6 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 goToFirstHead|org_state:intState|tlet1:0|dir1:L 6 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 goToFirstHead|org_state:reject|tlet1:0|dir1:L 6 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 6 goToFirstHead|org_state:start|tlet1:0|dir1:L 6 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 goToFirstHead|org_state:accept|tlet1:0|dir1:L 7 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 goToFirstHead|org_state:intState|tlet1:0|dir1:L 7 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 goToFirstHead|org_state:reject|tlet1:0|dir1:L 7 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 7 goToFirstHead|org_state:start|tlet1:0|dir1:L 7 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 goToFirstHead|org_state:accept|tlet1:0|dir1:L 8 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 goToFirstHead|org_state:intState|tlet1:0|dir1:L 8 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 goToFirstHead|org_state:reject|tlet1:0|dir1:L 8 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 8 goToFirstHead|org_state:start|tlet1:0|dir1:L 8 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 12 goToFirstHead|org_state:accept|tlet1:0|dir1:L 12 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 12 goToFirstHead|org_state:intState|tlet1:0|dir1:L 12 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 12 goToFirstHead|org_state:reject|tlet1:0|dir1:L 12 L
-goToFirstHead|org_state:start|tlet1:0|dir1:L 12 goToFirstHead|org_state:start|tlet1:0|dir1:L 12 L
+ReadLet2|org_state:intState|let1:1 8 ReadLet2|org_state:intState|let1:1 8 R
+ReadLet2|org_state:start|let1:0 4 executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 4 S
+ReadLet2|org_state:intState|let1:1 4 executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 4 S
+executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 4 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 R
+executeSecondHeadAction|org_state:intState|tlet1:1|tlet2:1|dir1:S|dir2:R 5 executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 R
+executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 4 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 R
+executeSecondHeadAction|org_state:accept|tlet1:0|tlet2:1|dir1:S|dir2:R 5 executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 R
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 4 R
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 1 goToFirstHead|org_state:accept|tlet1:0|dir1:S 5 R
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:accept|tlet1:0|dir1:S 8 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:S 4 R
+executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 4 R
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 1 goToFirstHead|org_state:intState|tlet1:1|dir1:S 5 R
+executeSecondHeadActionRightCheckIfExceedsTape|org_state:intState|tlet1:1|dir1:S 8 executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:S 4 R
+executeSecondHeadActionRightTapeExceededWriteNewSeparator|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
 goToFirstHead|org_state:accept|tlet1:0|dir1:S 0 goToFirstHead|org_state:accept|tlet1:0|dir1:S 0 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 0 goToFirstHead|org_state:intState|tlet1:0|dir1:S 0 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 0 goToFirstHead|org_state:reject|tlet1:0|dir1:S 0 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 0 goToFirstHead|org_state:start|tlet1:0|dir1:S 0 L
 goToFirstHead|org_state:accept|tlet1:0|dir1:S 1 goToFirstHead|org_state:accept|tlet1:0|dir1:S 1 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 1 goToFirstHead|org_state:intState|tlet1:0|dir1:S 1 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 1 goToFirstHead|org_state:reject|tlet1:0|dir1:S 1 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 1 goToFirstHead|org_state:start|tlet1:0|dir1:S 1 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 2 goToFirstHead|org_state:accept|tlet1:0|dir1:S 2 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 2 goToFirstHead|org_state:intState|tlet1:0|dir1:S 2 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 2 goToFirstHead|org_state:reject|tlet1:0|dir1:S 2 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 2 goToFirstHead|org_state:start|tlet1:0|dir1:S 2 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 goToFirstHead|org_state:accept|tlet1:0|dir1:S 6 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 goToFirstHead|org_state:intState|tlet1:0|dir1:S 6 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 goToFirstHead|org_state:reject|tlet1:0|dir1:S 6 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 6 goToFirstHead|org_state:start|tlet1:0|dir1:S 6 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 goToFirstHead|org_state:accept|tlet1:0|dir1:S 7 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 goToFirstHead|org_state:intState|tlet1:0|dir1:S 7 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 goToFirstHead|org_state:reject|tlet1:0|dir1:S 7 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 7 goToFirstHead|org_state:start|tlet1:0|dir1:S 7 L
+goToFirstHead|org_state:accept|tlet1:0|dir1:S 4 goToFirstHead|org_state:accept|tlet1:0|dir1:S 4 L
+goToFirstHead|org_state:accept|tlet1:0|dir1:S 5 goToFirstHead|org_state:accept|tlet1:0|dir1:S 5 L
 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 goToFirstHead|org_state:accept|tlet1:0|dir1:S 8 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 goToFirstHead|org_state:intState|tlet1:0|dir1:S 8 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 goToFirstHead|org_state:reject|tlet1:0|dir1:S 8 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 8 goToFirstHead|org_state:start|tlet1:0|dir1:S 8 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 12 goToFirstHead|org_state:accept|tlet1:0|dir1:S 12 L
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 12 goToFirstHead|org_state:intState|tlet1:0|dir1:S 12 L
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 12 goToFirstHead|org_state:reject|tlet1:0|dir1:S 12 L
-goToFirstHead|org_state:start|tlet1:0|dir1:S 12 goToFirstHead|org_state:start|tlet1:0|dir1:S 12 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 0 goToFirstHead|org_state:accept|tlet1:1|dir1:R 0 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 0 goToFirstHead|org_state:intState|tlet1:1|dir1:R 0 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 0 goToFirstHead|org_state:reject|tlet1:1|dir1:R 0 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 0 goToFirstHead|org_state:start|tlet1:1|dir1:R 0 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 1 goToFirstHead|org_state:accept|tlet1:1|dir1:R 1 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 1 goToFirstHead|org_state:intState|tlet1:1|dir1:R 1 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 1 goToFirstHead|org_state:reject|tlet1:1|dir1:R 1 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 1 goToFirstHead|org_state:start|tlet1:1|dir1:R 1 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 2 goToFirstHead|org_state:accept|tlet1:1|dir1:R 2 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 2 goToFirstHead|org_state:intState|tlet1:1|dir1:R 2 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 2 goToFirstHead|org_state:reject|tlet1:1|dir1:R 2 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 2 goToFirstHead|org_state:start|tlet1:1|dir1:R 2 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 goToFirstHead|org_state:accept|tlet1:1|dir1:R 6 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 goToFirstHead|org_state:intState|tlet1:1|dir1:R 6 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 goToFirstHead|org_state:reject|tlet1:1|dir1:R 6 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 6 goToFirstHead|org_state:start|tlet1:1|dir1:R 6 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 goToFirstHead|org_state:accept|tlet1:1|dir1:R 7 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 goToFirstHead|org_state:intState|tlet1:1|dir1:R 7 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 goToFirstHead|org_state:reject|tlet1:1|dir1:R 7 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 7 goToFirstHead|org_state:start|tlet1:1|dir1:R 7 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 goToFirstHead|org_state:accept|tlet1:1|dir1:R 8 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 goToFirstHead|org_state:intState|tlet1:1|dir1:R 8 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 goToFirstHead|org_state:reject|tlet1:1|dir1:R 8 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 8 goToFirstHead|org_state:start|tlet1:1|dir1:R 8 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 12 goToFirstHead|org_state:accept|tlet1:1|dir1:R 12 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 12 goToFirstHead|org_state:intState|tlet1:1|dir1:R 12 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 12 goToFirstHead|org_state:reject|tlet1:1|dir1:R 12 L
-goToFirstHead|org_state:start|tlet1:1|dir1:R 12 goToFirstHead|org_state:start|tlet1:1|dir1:R 12 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 0 goToFirstHead|org_state:accept|tlet1:1|dir1:L 0 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 0 goToFirstHead|org_state:intState|tlet1:1|dir1:L 0 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 0 goToFirstHead|org_state:reject|tlet1:1|dir1:L 0 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 0 goToFirstHead|org_state:start|tlet1:1|dir1:L 0 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 1 goToFirstHead|org_state:accept|tlet1:1|dir1:L 1 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 1 goToFirstHead|org_state:intState|tlet1:1|dir1:L 1 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 1 goToFirstHead|org_state:reject|tlet1:1|dir1:L 1 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 1 goToFirstHead|org_state:start|tlet1:1|dir1:L 1 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 2 goToFirstHead|org_state:accept|tlet1:1|dir1:L 2 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 2 goToFirstHead|org_state:intState|tlet1:1|dir1:L 2 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 2 goToFirstHead|org_state:reject|tlet1:1|dir1:L 2 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 2 goToFirstHead|org_state:start|tlet1:1|dir1:L 2 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 goToFirstHead|org_state:accept|tlet1:1|dir1:L 6 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 goToFirstHead|org_state:intState|tlet1:1|dir1:L 6 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 goToFirstHead|org_state:reject|tlet1:1|dir1:L 6 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 6 goToFirstHead|org_state:start|tlet1:1|dir1:L 6 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 goToFirstHead|org_state:accept|tlet1:1|dir1:L 7 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 goToFirstHead|org_state:intState|tlet1:1|dir1:L 7 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 goToFirstHead|org_state:reject|tlet1:1|dir1:L 7 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 7 goToFirstHead|org_state:start|tlet1:1|dir1:L 7 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 goToFirstHead|org_state:accept|tlet1:1|dir1:L 8 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 goToFirstHead|org_state:intState|tlet1:1|dir1:L 8 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 goToFirstHead|org_state:reject|tlet1:1|dir1:L 8 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 8 goToFirstHead|org_state:start|tlet1:1|dir1:L 8 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 12 goToFirstHead|org_state:accept|tlet1:1|dir1:L 12 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 12 goToFirstHead|org_state:intState|tlet1:1|dir1:L 12 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 12 goToFirstHead|org_state:reject|tlet1:1|dir1:L 12 L
-goToFirstHead|org_state:start|tlet1:1|dir1:L 12 goToFirstHead|org_state:start|tlet1:1|dir1:L 12 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 0 goToFirstHead|org_state:accept|tlet1:1|dir1:S 0 L
+goToFirstHead|org_state:accept|tlet1:0|dir1:S 2 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 2 S
+goToFirstHead|org_state:accept|tlet1:0|dir1:S 3 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 3 S
 goToFirstHead|org_state:intState|tlet1:1|dir1:S 0 goToFirstHead|org_state:intState|tlet1:1|dir1:S 0 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 0 goToFirstHead|org_state:reject|tlet1:1|dir1:S 0 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 0 goToFirstHead|org_state:start|tlet1:1|dir1:S 0 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 1 goToFirstHead|org_state:accept|tlet1:1|dir1:S 1 L
 goToFirstHead|org_state:intState|tlet1:1|dir1:S 1 goToFirstHead|org_state:intState|tlet1:1|dir1:S 1 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 1 goToFirstHead|org_state:reject|tlet1:1|dir1:S 1 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 1 goToFirstHead|org_state:start|tlet1:1|dir1:S 1 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 2 goToFirstHead|org_state:accept|tlet1:1|dir1:S 2 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 2 goToFirstHead|org_state:intState|tlet1:1|dir1:S 2 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 2 goToFirstHead|org_state:reject|tlet1:1|dir1:S 2 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 2 goToFirstHead|org_state:start|tlet1:1|dir1:S 2 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 goToFirstHead|org_state:accept|tlet1:1|dir1:S 6 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 goToFirstHead|org_state:intState|tlet1:1|dir1:S 6 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 goToFirstHead|org_state:reject|tlet1:1|dir1:S 6 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 6 goToFirstHead|org_state:start|tlet1:1|dir1:S 6 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 goToFirstHead|org_state:accept|tlet1:1|dir1:S 7 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 goToFirstHead|org_state:intState|tlet1:1|dir1:S 7 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 goToFirstHead|org_state:reject|tlet1:1|dir1:S 7 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 7 goToFirstHead|org_state:start|tlet1:1|dir1:S 7 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 goToFirstHead|org_state:accept|tlet1:1|dir1:S 8 L
+goToFirstHead|org_state:intState|tlet1:1|dir1:S 4 goToFirstHead|org_state:intState|tlet1:1|dir1:S 4 L
+goToFirstHead|org_state:intState|tlet1:1|dir1:S 5 goToFirstHead|org_state:intState|tlet1:1|dir1:S 5 L
 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 goToFirstHead|org_state:intState|tlet1:1|dir1:S 8 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 goToFirstHead|org_state:reject|tlet1:1|dir1:S 8 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 8 goToFirstHead|org_state:start|tlet1:1|dir1:S 8 L
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 12 goToFirstHead|org_state:accept|tlet1:1|dir1:S 12 L
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 12 goToFirstHead|org_state:intState|tlet1:1|dir1:S 12 L
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 12 goToFirstHead|org_state:reject|tlet1:1|dir1:S 12 L
-goToFirstHead|org_state:start|tlet1:1|dir1:S 12 goToFirstHead|org_state:start|tlet1:1|dir1:S 12 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 0 goToFirstHead|org_state:accept|tlet1:2|dir1:R 0 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 0 goToFirstHead|org_state:intState|tlet1:2|dir1:R 0 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 0 goToFirstHead|org_state:reject|tlet1:2|dir1:R 0 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 0 goToFirstHead|org_state:start|tlet1:2|dir1:R 0 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 1 goToFirstHead|org_state:accept|tlet1:2|dir1:R 1 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 1 goToFirstHead|org_state:intState|tlet1:2|dir1:R 1 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 1 goToFirstHead|org_state:reject|tlet1:2|dir1:R 1 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 1 goToFirstHead|org_state:start|tlet1:2|dir1:R 1 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 2 goToFirstHead|org_state:accept|tlet1:2|dir1:R 2 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 2 goToFirstHead|org_state:intState|tlet1:2|dir1:R 2 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 2 goToFirstHead|org_state:reject|tlet1:2|dir1:R 2 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 2 goToFirstHead|org_state:start|tlet1:2|dir1:R 2 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 goToFirstHead|org_state:accept|tlet1:2|dir1:R 6 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 goToFirstHead|org_state:intState|tlet1:2|dir1:R 6 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 goToFirstHead|org_state:reject|tlet1:2|dir1:R 6 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 6 goToFirstHead|org_state:start|tlet1:2|dir1:R 6 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 goToFirstHead|org_state:accept|tlet1:2|dir1:R 7 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 goToFirstHead|org_state:intState|tlet1:2|dir1:R 7 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 goToFirstHead|org_state:reject|tlet1:2|dir1:R 7 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 7 goToFirstHead|org_state:start|tlet1:2|dir1:R 7 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 goToFirstHead|org_state:accept|tlet1:2|dir1:R 8 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 goToFirstHead|org_state:intState|tlet1:2|dir1:R 8 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 goToFirstHead|org_state:reject|tlet1:2|dir1:R 8 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 8 goToFirstHead|org_state:start|tlet1:2|dir1:R 8 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 12 goToFirstHead|org_state:accept|tlet1:2|dir1:R 12 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 12 goToFirstHead|org_state:intState|tlet1:2|dir1:R 12 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 12 goToFirstHead|org_state:reject|tlet1:2|dir1:R 12 L
-goToFirstHead|org_state:start|tlet1:2|dir1:R 12 goToFirstHead|org_state:start|tlet1:2|dir1:R 12 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 0 goToFirstHead|org_state:accept|tlet1:2|dir1:L 0 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 0 goToFirstHead|org_state:intState|tlet1:2|dir1:L 0 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 0 goToFirstHead|org_state:reject|tlet1:2|dir1:L 0 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 0 goToFirstHead|org_state:start|tlet1:2|dir1:L 0 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 1 goToFirstHead|org_state:accept|tlet1:2|dir1:L 1 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 1 goToFirstHead|org_state:intState|tlet1:2|dir1:L 1 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 1 goToFirstHead|org_state:reject|tlet1:2|dir1:L 1 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 1 goToFirstHead|org_state:start|tlet1:2|dir1:L 1 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 2 goToFirstHead|org_state:accept|tlet1:2|dir1:L 2 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 2 goToFirstHead|org_state:intState|tlet1:2|dir1:L 2 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 2 goToFirstHead|org_state:reject|tlet1:2|dir1:L 2 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 2 goToFirstHead|org_state:start|tlet1:2|dir1:L 2 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 goToFirstHead|org_state:accept|tlet1:2|dir1:L 6 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 goToFirstHead|org_state:intState|tlet1:2|dir1:L 6 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 goToFirstHead|org_state:reject|tlet1:2|dir1:L 6 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 6 goToFirstHead|org_state:start|tlet1:2|dir1:L 6 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 goToFirstHead|org_state:accept|tlet1:2|dir1:L 7 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 goToFirstHead|org_state:intState|tlet1:2|dir1:L 7 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 goToFirstHead|org_state:reject|tlet1:2|dir1:L 7 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 7 goToFirstHead|org_state:start|tlet1:2|dir1:L 7 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 goToFirstHead|org_state:accept|tlet1:2|dir1:L 8 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 goToFirstHead|org_state:intState|tlet1:2|dir1:L 8 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 goToFirstHead|org_state:reject|tlet1:2|dir1:L 8 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 8 goToFirstHead|org_state:start|tlet1:2|dir1:L 8 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 12 goToFirstHead|org_state:accept|tlet1:2|dir1:L 12 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 12 goToFirstHead|org_state:intState|tlet1:2|dir1:L 12 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 12 goToFirstHead|org_state:reject|tlet1:2|dir1:L 12 L
-goToFirstHead|org_state:start|tlet1:2|dir1:L 12 goToFirstHead|org_state:start|tlet1:2|dir1:L 12 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 0 goToFirstHead|org_state:accept|tlet1:2|dir1:S 0 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 0 goToFirstHead|org_state:intState|tlet1:2|dir1:S 0 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 0 goToFirstHead|org_state:reject|tlet1:2|dir1:S 0 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 0 goToFirstHead|org_state:start|tlet1:2|dir1:S 0 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 1 goToFirstHead|org_state:accept|tlet1:2|dir1:S 1 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 1 goToFirstHead|org_state:intState|tlet1:2|dir1:S 1 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 1 goToFirstHead|org_state:reject|tlet1:2|dir1:S 1 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 1 goToFirstHead|org_state:start|tlet1:2|dir1:S 1 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 2 goToFirstHead|org_state:accept|tlet1:2|dir1:S 2 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 2 goToFirstHead|org_state:intState|tlet1:2|dir1:S 2 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 2 goToFirstHead|org_state:reject|tlet1:2|dir1:S 2 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 2 goToFirstHead|org_state:start|tlet1:2|dir1:S 2 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 goToFirstHead|org_state:accept|tlet1:2|dir1:S 6 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 goToFirstHead|org_state:intState|tlet1:2|dir1:S 6 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 goToFirstHead|org_state:reject|tlet1:2|dir1:S 6 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 6 goToFirstHead|org_state:start|tlet1:2|dir1:S 6 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 goToFirstHead|org_state:accept|tlet1:2|dir1:S 7 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 goToFirstHead|org_state:intState|tlet1:2|dir1:S 7 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 goToFirstHead|org_state:reject|tlet1:2|dir1:S 7 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 7 goToFirstHead|org_state:start|tlet1:2|dir1:S 7 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 goToFirstHead|org_state:accept|tlet1:2|dir1:S 8 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 goToFirstHead|org_state:intState|tlet1:2|dir1:S 8 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 goToFirstHead|org_state:reject|tlet1:2|dir1:S 8 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 8 goToFirstHead|org_state:start|tlet1:2|dir1:S 8 L
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 12 goToFirstHead|org_state:accept|tlet1:2|dir1:S 12 L
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 12 goToFirstHead|org_state:intState|tlet1:2|dir1:S 12 L
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 12 goToFirstHead|org_state:reject|tlet1:2|dir1:S 12 L
-goToFirstHead|org_state:start|tlet1:2|dir1:S 12 goToFirstHead|org_state:start|tlet1:2|dir1:S 12 L
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 3 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:R 3 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 3 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:R 3 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 3 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:R 3 S
-goToFirstHead|org_state:start|tlet1:0|dir1:R 3 executeFirstHeadAction|org_state:start|tlet1:0|dir1:R 3 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 4 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:R 4 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 4 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:R 4 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 4 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:R 4 S
-goToFirstHead|org_state:start|tlet1:0|dir1:R 4 executeFirstHeadAction|org_state:start|tlet1:0|dir1:R 4 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:R 5 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:R 5 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:R 5 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:R 5 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:R 5 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:R 5 S
-goToFirstHead|org_state:start|tlet1:0|dir1:R 5 executeFirstHeadAction|org_state:start|tlet1:0|dir1:R 5 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 3 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:L 3 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 3 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:L 3 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 3 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:L 3 S
-goToFirstHead|org_state:start|tlet1:0|dir1:L 3 executeFirstHeadAction|org_state:start|tlet1:0|dir1:L 3 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 4 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:L 4 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 4 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:L 4 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 4 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:L 4 S
-goToFirstHead|org_state:start|tlet1:0|dir1:L 4 executeFirstHeadAction|org_state:start|tlet1:0|dir1:L 4 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:L 5 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:L 5 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:L 5 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:L 5 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:L 5 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:L 5 S
-goToFirstHead|org_state:start|tlet1:0|dir1:L 5 executeFirstHeadAction|org_state:start|tlet1:0|dir1:L 5 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 3 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 3 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 3 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 3 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 3 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 3 S
-goToFirstHead|org_state:start|tlet1:0|dir1:S 3 executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 3 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 4 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 4 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 4 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 4 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 4 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 4 S
-goToFirstHead|org_state:start|tlet1:0|dir1:S 4 executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 4 S
-goToFirstHead|org_state:accept|tlet1:0|dir1:S 5 executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 5 S
-goToFirstHead|org_state:intState|tlet1:0|dir1:S 5 executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 5 S
-goToFirstHead|org_state:reject|tlet1:0|dir1:S 5 executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 5 S
-goToFirstHead|org_state:start|tlet1:0|dir1:S 5 executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 5 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 3 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:R 3 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 3 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:R 3 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 3 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:R 3 S
-goToFirstHead|org_state:start|tlet1:1|dir1:R 3 executeFirstHeadAction|org_state:start|tlet1:1|dir1:R 3 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 4 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:R 4 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 4 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:R 4 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 4 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:R 4 S
-goToFirstHead|org_state:start|tlet1:1|dir1:R 4 executeFirstHeadAction|org_state:start|tlet1:1|dir1:R 4 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:R 5 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:R 5 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:R 5 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:R 5 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:R 5 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:R 5 S
-goToFirstHead|org_state:start|tlet1:1|dir1:R 5 executeFirstHeadAction|org_state:start|tlet1:1|dir1:R 5 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 3 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:L 3 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 3 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:L 3 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 3 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:L 3 S
-goToFirstHead|org_state:start|tlet1:1|dir1:L 3 executeFirstHeadAction|org_state:start|tlet1:1|dir1:L 3 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 4 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:L 4 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 4 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:L 4 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 4 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:L 4 S
-goToFirstHead|org_state:start|tlet1:1|dir1:L 4 executeFirstHeadAction|org_state:start|tlet1:1|dir1:L 4 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:L 5 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:L 5 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:L 5 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:L 5 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:L 5 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:L 5 S
-goToFirstHead|org_state:start|tlet1:1|dir1:L 5 executeFirstHeadAction|org_state:start|tlet1:1|dir1:L 5 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 3 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 3 S
+goToFirstHead|org_state:intState|tlet1:1|dir1:S 2 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 2 S
 goToFirstHead|org_state:intState|tlet1:1|dir1:S 3 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 3 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 3 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 3 S
-goToFirstHead|org_state:start|tlet1:1|dir1:S 3 executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 3 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 4 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 4 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 4 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 4 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 4 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 4 S
-goToFirstHead|org_state:start|tlet1:1|dir1:S 4 executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 4 S
-goToFirstHead|org_state:accept|tlet1:1|dir1:S 5 executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 5 S
-goToFirstHead|org_state:intState|tlet1:1|dir1:S 5 executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 5 S
-goToFirstHead|org_state:reject|tlet1:1|dir1:S 5 executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 5 S
-goToFirstHead|org_state:start|tlet1:1|dir1:S 5 executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 5 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 3 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:R 3 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 3 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:R 3 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 3 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:R 3 S
-goToFirstHead|org_state:start|tlet1:2|dir1:R 3 executeFirstHeadAction|org_state:start|tlet1:2|dir1:R 3 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 4 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:R 4 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 4 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:R 4 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 4 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:R 4 S
-goToFirstHead|org_state:start|tlet1:2|dir1:R 4 executeFirstHeadAction|org_state:start|tlet1:2|dir1:R 4 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:R 5 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:R 5 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:R 5 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:R 5 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:R 5 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:R 5 S
-goToFirstHead|org_state:start|tlet1:2|dir1:R 5 executeFirstHeadAction|org_state:start|tlet1:2|dir1:R 5 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 3 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:L 3 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 3 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:L 3 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 3 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:L 3 S
-goToFirstHead|org_state:start|tlet1:2|dir1:L 3 executeFirstHeadAction|org_state:start|tlet1:2|dir1:L 3 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 4 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:L 4 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 4 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:L 4 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 4 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:L 4 S
-goToFirstHead|org_state:start|tlet1:2|dir1:L 4 executeFirstHeadAction|org_state:start|tlet1:2|dir1:L 4 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:L 5 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:L 5 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:L 5 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:L 5 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:L 5 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:L 5 S
-goToFirstHead|org_state:start|tlet1:2|dir1:L 5 executeFirstHeadAction|org_state:start|tlet1:2|dir1:L 5 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 3 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 3 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 3 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 3 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 3 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 3 S
-goToFirstHead|org_state:start|tlet1:2|dir1:S 3 executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 3 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 4 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 4 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 4 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 4 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 4 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 4 S
-goToFirstHead|org_state:start|tlet1:2|dir1:S 4 executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 4 S
-goToFirstHead|org_state:accept|tlet1:2|dir1:S 5 executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 5 S
-goToFirstHead|org_state:intState|tlet1:2|dir1:S 5 executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 5 S
-goToFirstHead|org_state:reject|tlet1:2|dir1:S 5 executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 5 S
-goToFirstHead|org_state:start|tlet1:2|dir1:S 5 executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 5 S
-executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 3 checkIfTerminalState|org_state:accept 3 S
-executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 3 checkIfTerminalState|org_state:intState 3 S
-executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 3 checkIfTerminalState|org_state:reject 3 S
-executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 3 checkIfTerminalState|org_state:start 3 S
-executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 4 checkIfTerminalState|org_state:accept 3 S
-executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 4 checkIfTerminalState|org_state:intState 3 S
-executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 4 checkIfTerminalState|org_state:reject 3 S
-executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 4 checkIfTerminalState|org_state:start 3 S
-executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 5 checkIfTerminalState|org_state:accept 3 S
-executeFirstHeadAction|org_state:intState|tlet1:0|dir1:S 5 checkIfTerminalState|org_state:intState 3 S
-executeFirstHeadAction|org_state:reject|tlet1:0|dir1:S 5 checkIfTerminalState|org_state:reject 3 S
-executeFirstHeadAction|org_state:start|tlet1:0|dir1:S 5 checkIfTerminalState|org_state:start 3 S
-executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 3 checkIfTerminalState|org_state:accept 4 S
-executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 3 checkIfTerminalState|org_state:intState 4 S
-executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 3 checkIfTerminalState|org_state:reject 4 S
-executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 3 checkIfTerminalState|org_state:start 4 S
-executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 4 checkIfTerminalState|org_state:accept 4 S
-executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 4 checkIfTerminalState|org_state:intState 4 S
-executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 4 checkIfTerminalState|org_state:reject 4 S
-executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 4 checkIfTerminalState|org_state:start 4 S
-executeFirstHeadAction|org_state:accept|tlet1:1|dir1:S 5 checkIfTerminalState|org_state:accept 4 S
-executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 5 checkIfTerminalState|org_state:intState 4 S
-executeFirstHeadAction|org_state:reject|tlet1:1|dir1:S 5 checkIfTerminalState|org_state:reject 4 S
-executeFirstHeadAction|org_state:start|tlet1:1|dir1:S 5 checkIfTerminalState|org_state:start 4 S
-executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 3 checkIfTerminalState|org_state:accept 5 S
-executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 3 checkIfTerminalState|org_state:intState 5 S
-executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 3 checkIfTerminalState|org_state:reject 5 S
-executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 3 checkIfTerminalState|org_state:start 5 S
-executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 4 checkIfTerminalState|org_state:accept 5 S
-executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 4 checkIfTerminalState|org_state:intState 5 S
-executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 4 checkIfTerminalState|org_state:reject 5 S
-executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 4 checkIfTerminalState|org_state:start 5 S
-executeFirstHeadAction|org_state:accept|tlet1:2|dir1:S 5 checkIfTerminalState|org_state:accept 5 S
-executeFirstHeadAction|org_state:intState|tlet1:2|dir1:S 5 checkIfTerminalState|org_state:intState 5 S
-executeFirstHeadAction|org_state:reject|tlet1:2|dir1:S 5 checkIfTerminalState|org_state:reject 5 S
-executeFirstHeadAction|org_state:start|tlet1:2|dir1:S 5 checkIfTerminalState|org_state:start 5 S
+executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 2 checkIfTerminalState|org_state:accept 2 S
+executeFirstHeadAction|org_state:accept|tlet1:0|dir1:S 3 checkIfTerminalState|org_state:accept 2 S
+executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 2 checkIfTerminalState|org_state:intState 3 S
+executeFirstHeadAction|org_state:intState|tlet1:1|dir1:S 3 checkIfTerminalState|org_state:intState 3 S
+checkIfTerminalState|org_state:accept 2 accept 2 S
 checkIfTerminalState|org_state:accept 3 accept 3 S
-checkIfTerminalState|org_state:reject 3 reject 3 S
-checkIfTerminalState|org_state:accept 4 accept 4 S
-checkIfTerminalState|org_state:reject 4 reject 4 S
-checkIfTerminalState|org_state:accept 5 accept 5 S
-checkIfTerminalState|org_state:reject 5 reject 5 S
-checkIfTerminalState|org_state:intState 3 ReadLet2|org_state:intState|let1:0 3 R
-checkIfTerminalState|org_state:start 3 ReadLet2|org_state:start|let1:0 3 R
-checkIfTerminalState|org_state:intState 4 ReadLet2|org_state:intState|let1:1 4 R
-checkIfTerminalState|org_state:start 4 ReadLet2|org_state:start|let1:1 4 R
-checkIfTerminalState|org_state:intState 5 ReadLet2|org_state:intState|let1:2 5 R
-checkIfTerminalState|org_state:start 5 ReadLet2|org_state:start|let1:2 5 R
+checkIfTerminalState|org_state:intState 3 ReadLet2|org_state:intState|let1:1 3 R
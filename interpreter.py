@@ -1,11 +1,268 @@
 #!/usr/bin/python3
 
 import sys
+from collections import defaultdict
 
 BLANK = 0
 ACCEPT_STATE = "accept"
 REJECT_STATE = "reject"
 START_STATE = "start"
+# States are interned to consecutive ids when the machine is loaded. The
+# special states always get the first ids.
+START_ID = 0
+ACCEPT_ID = 1
+REJECT_ID = 2
+# Directions are stored as head deltas.
+DIRECTIONS = {"L": -1, "R": 1, "S": 0}
+# Returned by get_next_configurations instead of the successors when one of
+# them is in the accepting state.
+ACCEPTING = object()
+TAPE_FANOUT_BITS = 5
+TAPE_FANOUT = 1 << TAPE_FANOUT_BITS
+TAPE_MASK = TAPE_FANOUT - 1
+# Letters which fit in a byte are stored in bytes leaves.
+BYTE_LETTERS = 256
+_BYTES = [bytes((letter,)) for letter in range(BYTE_LETTERS)]
+# Tables indexed by (state, letter) are flat lists, unless they would have
+# more than DENSE_TABLE_MAX_SIZE entries and DENSE_TABLE_RATIO times as many
+# entries as the machine has transitions. Then they are _SparseTables.
+DENSE_TABLE_MAX_SIZE = 1 << 16
+DENSE_TABLE_RATIO = 16
+
+
+class PTape(object):
+    """ Persistent (immutable) tape with structural sharing.
+
+        The letters are stored in a tree of fixed depth. Leaves hold at most
+        TAPE_FANOUT letters and inner nodes are tuples of at most TAPE_FANOUT
+        children. A leaf is a bytes object if all its letters are smaller
+        than BYTE_LETTERS and a tuple otherwise, so equal tapes always have
+        equal leaves. Every node is kept as a pair (hash, items), so
+        the hash of the whole tape is cached at the root and only the nodes
+        on the modified path have to be rehashed.
+
+        Writing a letter or appending a letter copies only the path from the
+        root to the modified leaf - O(log n) instead of O(n) for tuple slicing.
+        All other nodes are shared between the old and the new tape.
+
+    """
+
+    __slots__ = ("_root", "_len", "_shift")
+
+    def __init__(self, letters=()):
+        letters = tuple(letters)
+        nodes = [_leaf(letters[i:(i + TAPE_FANOUT)]) for i in range(0, len(letters), TAPE_FANOUT)]
+        if not nodes:
+            nodes = [_leaf(())]
+        shift = 0
+        while len(nodes) > 1:
+            nodes = [_inner(tuple(nodes[i:(i + TAPE_FANOUT)])) for i in range(0, len(nodes), TAPE_FANOUT)]
+            shift += TAPE_FANOUT_BITS
+        self._root = nodes[0]
+        self._len = len(letters)
+        self._shift = shift
+
+    @classmethod
+    def _make(cls, root, length, shift):
+        tape = cls.__new__(cls)
+        tape._root = root
+        tape._len = length
+        tape._shift = shift
+        return tape
+
+    def get(self, i):
+        """Returns the letter at a given position.
+
+        Args:
+            i (int): Position on the tape.
+
+        Returns:
+            int: Letter at the position i.
+        """
+        if not 0 <= i < self._len:
+            raise IndexError("tape index out of range")
+        node = self._root
+        shift = self._shift
+        while shift > 0:
+            node = node[1][(i >> shift) & TAPE_MASK]
+            shift -= TAPE_FANOUT_BITS
+        return node[1][i & TAPE_MASK]
+
+    def set(self, i, letter):
+        """Returns a new tape with the letter at a given position replaced.
+
+        Args:
+            i (int): Position on the tape.
+            letter (int): Letter to write.
+
+        Returns:
+            PTape: New tape. The original tape is left unchanged.
+        """
+        if self.get(i) == letter:
+            return self
+        return PTape._make(_set(self._root, self._shift, i, letter), self._len, self._shift)
+
+    def append(self, letter):
+        """Returns a new tape extended by a given letter.
+
+        Args:
+            letter (int): Letter to append.
+
+        Returns:
+            PTape: New tape. The original tape is left unchanged.
+        """
+        length = self._len
+        shift = self._shift
+        if length == 1 << (shift + TAPE_FANOUT_BITS):
+            # The tree is full - add a new level on top of the current root.
+            root = _inner((self._root, _path(shift, letter)))
+            shift += TAPE_FANOUT_BITS
+        else:
+            root = _push(self._root, shift, length, letter)
+        return PTape._make(root, length + 1, shift)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self.get(i)
+
+    def __hash__(self):
+        return self._root[0]
+
+    def __eq__(self, other):
+        if not isinstance(other, PTape):
+            return NotImplemented
+        return self._len == other._len and self._root == other._root
+
+    def __repr__(self):
+        return "PTape(%r)" % (tuple(self),)
+
+
+def _leaf(letters):
+    if type(letters) is not bytes and max(letters, default=BLANK) < BYTE_LETTERS:
+        letters = bytes(letters)
+    return (hash(letters), letters)
+
+
+def _inner(children):
+    return (hash(tuple(child[0] for child in children)), children)
+
+
+def _set(node, shift, i, letter):
+    items = node[1]
+    idx = (i >> shift) & TAPE_MASK
+    if shift == 0:
+        if type(items) is bytes and letter < BYTE_LETTERS:
+            return _leaf(items[:idx] + _BYTES[letter] + items[(idx + 1):])
+        return _leaf(tuple(items[:idx]) + (letter,) + tuple(items[(idx + 1):]))
+    child = _set(items[idx], shift - TAPE_FANOUT_BITS, i, letter)
+    return _inner(items[:idx] + (child,) + items[(idx + 1):])
+
+
+def _push(node, shift, i, letter):
+    items = node[1]
+    if shift == 0:
+        if type(items) is bytes and letter < BYTE_LETTERS:
+            return _leaf(items + _BYTES[letter])
+        return _leaf(tuple(items) + (letter,))
+    idx = (i >> shift) & TAPE_MASK
+    if idx < len(items):
+        return _inner(items[:idx] + (_push(items[idx], shift - TAPE_FANOUT_BITS, i, letter),))
+    return _inner(items + (_path(shift - TAPE_FANOUT_BITS, letter),))
+
+
+def _path(shift, letter):
+    node = _leaf((letter,))
+    while shift > 0:
+        node = _inner((node,))
+        shift -= TAPE_FANOUT_BITS
+    return node
+
+
+class _SparseTable(dict):
+    """ Dict standing in for a flat table. Missing entries are None, as in
+        the list it replaces.
+
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return None
+
+
+class Conf(object):
+    """ Configuration of the Turing machine: (state_id, tape, head_pos).
+
+        The hash is computed on first use and cached, so looking up the same
+        configuration in several sets does not hash the tape again.
+
+    """
+
+    __slots__ = ("state", "tape", "head", "_h")
+
+    def __init__(self, state, tape, head):
+        self.state = state
+        self.tape = tape
+        self.head = head
+        self._h = None
+
+    def __hash__(self):
+        if self._h is None:
+            self._h = hash((self.state, self.tape, self.head))
+        return self._h
+
+    def __eq__(self, other):
+        if not isinstance(other, Conf):
+            return NotImplemented
+        return (hash(self) == hash(other) and self.head == other.head and self.state == other.state
+                and self.tape == other.tape)
+
+    def __repr__(self):
+        return "Conf(%r, %r, %r)" % (self.state, self.tape, self.head)
+
+
+def _make_step(transitions):
+    """Builds the step function of a single (state, letter) pair.
+
+    A step function takes (tape, head_pos) and returns the configurations
+    reachable in one transition. Target states, letters and head moves are
+    bound in the closure, so a step does not unpack transitions nor branch
+    on the direction. Steps of deterministic pairs return a one element
+    tuple instead of building a list.
+
+    Args:
+        transitions ([(int, int, int)]): Applicable transitions
+            (target_state, target_letter, delta).
+
+    Returns:
+        function: Step function of the pair.
+    """
+    if len(transitions) > 1:
+        steps = [_make_step([transition]) for transition in transitions]
+
+        def step(tape, head_pos):
+            return [single_step(tape, head_pos)[0] for single_step in steps]
+        return step
+
+    ((target_state, target_letter, delta),) = transitions
+    if delta < 0:
+        # Move head to the left if isn't at leftmost position
+        def step(tape, head_pos):
+            return (Conf(target_state, tape.set(head_pos, target_letter), head_pos - 1 if head_pos > 0 else 0),)
+    elif delta > 0:
+        # Move head to the right. Extend the tape by a blank if neccessary.
+        def step(tape, head_pos):
+            new_tape = tape.set(head_pos, target_letter)
+            if head_pos + 1 == len(tape):
+                new_tape = new_tape.append(BLANK)
+            return (Conf(target_state, new_tape, head_pos + 1),)
+    else:
+        def step(tape, head_pos):
+            return (Conf(target_state, tape.set(head_pos, target_letter), head_pos),)
+    return step
 
 
 class TuringMachine(object):
@@ -28,6 +285,9 @@ class TuringMachine(object):
         applicable transition
         - looping forever
 
+        Internally states are interned to integer ids (see START_ID, ACCEPT_ID
+        and REJECT_ID) and directions to head deltas -1, 1 and 0.
+
         The Turing machine does not have to have/use the reject state.
         The machine first writes the output letter and then moves its head.
         The machine cannot move left in the first position -- if it tries to,
@@ -40,7 +300,31 @@ class TuringMachine(object):
 
     def __init__(self, path):
         self._transitions = {}
+        self._sid = {START_STATE: START_ID, ACCEPT_STATE: ACCEPT_ID, REJECT_STATE: REJECT_ID}
+        self._states = [START_STATE, ACCEPT_STATE, REJECT_STATE]
         self._read_turing_machine(path)
+        self._deterministic = all(len(results) == 1 for results in self._transitions.values())
+        # The kernel runs deterministic machines, the search all the others.
+        if self._deterministic:
+            self._build_kernel_table()
+            self._build_superoperators()
+        else:
+            self._build_steps()
+            self._find_accepting_letters()
+
+    def _state_id(self, state):
+        """Interns a state name.
+
+        Args:
+            state (str): State name.
+
+        Returns:
+            int: Id of the state. New states get the next free id.
+        """
+        if state not in self._sid:
+            self._sid[state] = len(self._states)
+            self._states.append(state)
+        return self._sid[state]
 
     def _read_turing_machine(self, path):
         """Reads a set of TM transitions from a *.tm file
@@ -49,27 +333,153 @@ class TuringMachine(object):
             path (str): Path to the *.tm file with transitions.
 
         """
-        for transition in open(path, "r").read().split("\n"):
-            # Edge case when input file ends with a newline character
-            if transition != "":
-                [cur_state, cur_letter, target_state, target_letter, direction] = transition.split(" ")
+        transitions = defaultdict(list)
+        with open(path, "r") as tm_file:
+            for transition in tm_file:
+                parts = transition.split()
+                # Skip empty lines, e.g. when input file ends with a newline character
+                if not parts:
+                    continue
+                [cur_state, cur_letter, target_state, target_letter, direction] = parts
                 try:
                     cur_letter = int(cur_letter)
                     target_letter = int(target_letter)
                 except ValueError:
                     print("Error: Invalid letter in transition! Tape alphabet is natural numbers.")
                     sys.exit()
-                assert direction in ("L", "R", "S")
-                if (cur_state, cur_letter) not in self._transitions:
-                    self._transitions[(cur_state, cur_letter)] = []
-                self._transitions[(cur_state, cur_letter)].append((target_state, target_letter, direction))
+                # Letters index the tape and the transition tables.
+                if cur_letter < 0 or target_letter < 0:
+                    print("Error: Invalid letter in transition! Tape alphabet is natural numbers.")
+                    sys.exit()
+                assert direction in DIRECTIONS
+                key = (self._state_id(cur_state), cur_letter)
+                transitions[key].append((self._state_id(target_state), target_letter, DIRECTIONS[direction]))
+        # Drop repeated transitions, so that the successors of a configuration
+        # do not have to be deduplicated during the search.
+        self._transitions = {key: list(dict.fromkeys(results)) for (key, results) in transitions.items()}
+        letters = [letter for (_, letter) in self._transitions]
+        letters += [target_letter for results in self._transitions.values() for (_, target_letter, _) in results]
+        self._n_letters = max(letters + [BLANK]) + 1
+        table_size = len(self._states) * self._n_letters
+        self._sparse = table_size > max(DENSE_TABLE_MAX_SIZE, DENSE_TABLE_RATIO * len(self._transitions))
+
+    def _new_table(self, size):
+        """Creates a table of None entries indexed by (state, letter).
+
+        Args:
+            size (int): Number of entries of the equivalent flat list.
+
+        Returns:
+            list or _SparseTable: Flat list unless the machine has a large
+                alphabet compared to its number of transitions.
+        """
+        return _SparseTable() if self._sparse else [None] * size
+
+    def _build_kernel_table(self):
+        """Builds the kernel table of a deterministic machine.
+
+        The kernel table is indexed by state_id * self._n_letters + letter
+        and holds the only applicable transition of every (state, letter)
+        pair (or None), so a step is a single subscript.
+
+        """
+        self._kernel_table = self._new_table(len(self._states) * self._n_letters)
+        for ((state, letter), (transition,)) in self._transitions.items():
+            self._kernel_table[state * self._n_letters + letter] = transition
+
+    def _build_superoperators(self):
+        """Path-compresses deterministic transitions for the kernel.
+
+        Two kinds of superoperators are built:
+        - self._superops has the same layout as the kernel table, but every
+          transition which does not move the head is composed with the
+          transitions following it on the same cell. An entry is
+          (target_state, target_letter, delta, steps), where steps is the
+          number of original transitions it replaces. Chains which never
+          leave the cell nor halt are replaced by None, as the machine loops
+          forever there.
+        - self._scans[state_id] is (delta, letters) if the state moves over
+          letters in one direction without changing them and without changing
+          the state, e.g. "go right until #". The kernel then moves the head
+          over the whole run of such letters at once.
+
+        """
+        n_letters = self._n_letters
+        table = self._kernel_table
+        self._superops = self._new_table(len(self._states) * n_letters)
+        for (state, letter) in self._transitions:
+            self._superops[state * n_letters + letter] = self._compose_stay_chain(state, letter)
+
+        self._scans = [None] * len(self._states)
+        if n_letters > BYTE_LETTERS:
+            return
+        for state in range(len(self._states)):
+            moves = defaultdict(list)
+            for letter in range(n_letters):
+                transition = table[state * n_letters + letter]
+                if transition is not None and transition[:2] == (state, letter) and transition[2] != 0:
+                    moves[transition[2]].append(letter)
+            if len(moves) == 1:
+                ((delta, letters),) = moves.items()
+                self._scans[state] = (delta, bytes(letters))
+
+    def _compose_stay_chain(self, state, letter):
+        """Composes the deterministic transitions starting in a given
+           (state, letter) pair for as long as they keep the head in place.
+
+        Args:
+            state (int): State id.
+            letter (int): Letter under the head.
+
+        Returns:
+            (int, int, int, int): Superoperator (target_state, target_letter,
+                delta, steps) or None if the machine loops forever on the cell.
+        """
+        table = self._kernel_table
+        n_letters = self._n_letters
+        seen = {(state, letter)}
+        steps = 0
+        while True:
+            transition = table[state * n_letters + letter]
+            if transition is None:
+                # The machine gets stuck after the chain.
+                return (state, letter, 0, steps)
+            (target_state, target_letter, delta) = transition
+            steps += 1
+            if delta != 0 or target_state in (ACCEPT_ID, REJECT_ID):
+                return (target_state, target_letter, delta, steps)
+            if (target_state, target_letter) in seen:
+                return None
+            seen.add((target_state, target_letter))
+            (state, letter) = (target_state, target_letter)
+
+    def _build_steps(self):
+        """Builds a step function for every (state, letter) pair and stores
+           them in self._step[state_id][letter]. See _make_step.
+
+        """
+        self._step = [self._new_table(self._n_letters) for _ in self._states]
+        for ((state, letter), transitions) in self._transitions.items():
+            self._step[state][letter] = _make_step(transitions)
+
+    def _find_accepting_letters(self):
+        """Finds, for every state, the letters for which some transition
+           goes straight to the accepting state. They are stored as sets in
+           self._accept_letters[state_id].
+
+        """
+        self._accept_letters = [set() for _ in self._states]
+        for ((state, letter), transitions) in self._transitions.items():
+            if any(target_state == ACCEPT_ID for (target_state, _, _) in transitions):
+                self._accept_letters[state].add(letter)
 
     def run(self, tape, max_steps):
         """Runs the TM over given input word on tape. The run is limited to a
-           given number of steps. The configurations are traversed using BFS.
-           If a given configuration have already appeared then there is a
-           cycle in transition graph. Configuration is a tuple:
-           (state, tape, head_pos).
+           given number of steps. The configurations are traversed using BFS,
+           one layer per step. A configuration is added to the history when
+           it is first reached, so each one is expanded only once, at the
+           smallest depth it can be reached at. Configuration is a Conf:
+           (state_id, tape, head_pos), where tape is a PTape.
 
         Args:
             tape ((int,)): Input word - initial tape values.
@@ -80,87 +490,139 @@ class TuringMachine(object):
                     the input word.
 
         """
-        head_pos = 0
-        state = START_STATE
-        tape += (BLANK,)
+        if max_steps < 1:
+            return False
+        if self._deterministic:
+            return self._run_deterministic(tape, max_steps)
+        tape = PTape(tape + (BLANK,))
         steps = 1
 
-        current_configurations = [(state, tape, head_pos)]
-        next_configurations = set()
-        history = set()
-
-        while len(current_configurations) and steps <= max_steps:
-            while len(current_configurations):
-                conf = current_configurations.pop()
-                if conf not in history:
-                    history |= {conf}
-                    if self.is_conf_terminal(conf):
-                        if self.is_conf_accepting(conf):
-                            return True
-                    else:
-                        next_configurations |= self.get_next_configurations(conf)
-
-            current_configurations = next_configurations.copy()
-            next_configurations.clear()
+        current_configurations = [Conf(START_ID, tape, 0)]
+        history = set(current_configurations)
+        # Hot names bound to locals.
+        get_next_configurations = self.get_next_configurations
+        add_to_history = history.add
+        accept = ACCEPT_ID
+        reject = REJECT_ID
+        accepting = ACCEPTING
+
+        while current_configurations:
+            next_configurations = []
+            append = next_configurations.append
+            for conf in current_configurations:
+                state = conf.state
+                if state == accept:
+                    return True
+                # Successors of the last layer would exceed max_steps.
+                if state == reject or steps == max_steps:
+                    continue
+                successors = get_next_configurations(conf)
+                if successors is accepting:
+                    return True
+                for next_conf in successors:
+                    if next_conf not in history:
+                        add_to_history(next_conf)
+                        append(next_conf)
+            current_configurations = next_configurations
             steps += 1
         return False
 
-    @staticmethod
-    def is_conf_terminal(conf):
-        """Check if configuration is a terminal one.
+    def _run_deterministic(self, tape, max_steps):
+        """Runs a deterministic TM. There is a single path of configurations,
+           so no configuration has to be stored and the tape (a bytearray if
+           all letters fit in a byte) is modified in place. Each step is only
+           integer work on the superoperators built from the kernel table.
 
         Args:
-            conf (configuration): Tuple (state, tape, head_pos)
+            tape ((int,)): Input word - initial tape values.
+            max_steps (int): Maximum steps allowed per run.
 
         Returns:
-            Bool: True if configuration is in a terminal state
-        """
-        (state, _, _) = conf
-        return state in (ACCEPT_STATE, REJECT_STATE)
-
-    @staticmethod
-    def is_conf_accepting(conf):
-        """Check if configuration is an accepting one.
-
-        Args:
-            conf (configuration): Tuple (state, tape, head_pos)
+            bool: True if TM accepts the input word. False if TM rejects
+                    the input word.
 
-        Returns:
-            Bool: True if configuration is in an accepting state
         """
-        (state, _, _) = conf
-        return state == ACCEPT_STATE
+        superops = self._superops
+        n_letters = self._n_letters
+        if n_letters <= BYTE_LETTERS and max(tape, default=BLANK) < BYTE_LETTERS:
+            tape = bytearray(tape)
+            scans = self._scans
+        else:
+            tape = list(tape)
+            scans = None
+        tape.append(BLANK)
+        # Hot names bound to locals.
+        tape_len = len(tape)
+        extend_tape = tape.append
+        blank = BLANK
+        accept = ACCEPT_ID
+        reject = REJECT_ID
+        state = START_ID
+        head_pos = 0
+        steps = 0
+        while steps < max_steps:
+            if state == accept:
+                return True
+            if state == reject:
+                return False
+            if scans is not None and scans[state] is not None and tape[head_pos] in scans[state][1]:
+                (delta, letters) = scans[state]
+                if delta > 0:
+                    rest = tape[head_pos:]
+                    stop = head_pos + len(rest) - len(rest.lstrip(letters))
+                    if stop == tape_len:
+                        if blank in letters:
+                            # The machine goes right forever.
+                            return False
+                        extend_tape(blank)
+                        tape_len += 1
+                    steps += stop - head_pos
+                else:
+                    stop = len(tape[:(head_pos + 1)].rstrip(letters)) - 1
+                    if stop < 0:
+                        # The machine is stuck in the leftmost position.
+                        return False
+                    steps += head_pos - stop
+                head_pos = stop
+                if steps >= max_steps:
+                    return False
+            letter = tape[head_pos]
+            superop = superops[state * n_letters + letter] if letter < n_letters else None
+            if superop is None:
+                # The machine got stuck or loops forever on the cell.
+                return False
+            (state, tape[head_pos], delta, cost) = superop
+            steps += cost
+            head_pos += delta
+            if head_pos < 0:
+                head_pos = 0
+            elif head_pos == tape_len:
+                extend_tape(blank)
+                tape_len += 1
+        return False
 
     def get_next_configurations(self, conf):
         """Generates all reachable configurations from a given configuration
            in one transition i.e. all neighbours in configuration graph.
 
         Args:
-            conf (configuration): Tuple (state, tape, head_pos)
+            conf (Conf): Configuration (state_id, tape, head_pos)
 
         Returns:
-            set(configuration): Set of all reachable configurations in one
-                                transition
+            [Conf]: All reachable configurations in one transition or
+                    ACCEPTING if one of them is an accepting one.
         """
-        (state, tape, head_pos) = conf
-        letter = tape[head_pos]
-        next_configurations = set()
-        for transition in self._transitions.get((state, letter), []):
-            (target_state, target_letter, direction) = transition
-            new_head_pos = head_pos
-            new_state = target_state
-            new_tape = tape[:head_pos] + (target_letter,) + tape[(head_pos + 1):]
-
-            if direction == "L" and new_head_pos > 0:
-                # Move head to the left if isn't at leftmost position
-                new_head_pos -= 1
-            elif direction == "R":
-                # Move head to the right. Extend the tape by a blank if neccessary.
-                new_head_pos += 1
-                if new_head_pos == len(tape):
-                    new_tape = tape[:head_pos] + (target_letter,) + tape[(head_pos + 1):] + (BLANK,)
-            next_configurations |= {(new_state, new_tape, new_head_pos)}
-        return next_configurations
+        state = conf.state
+        tape = conf.tape
+        head_pos = conf.head
+        letter = tape.get(head_pos)
+        if letter in self._accept_letters[state]:
+            return ACCEPTING
+        steps = self._step[state]
+        step = steps[letter] if letter < self._n_letters else None
+        if step is None:
+            return ()
+        return step(tape, head_pos)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,14 @@
 #!/usr/bin/python3
 
+import gc
+import hashlib
+import os
+import shutil
 import sys
+import tempfile
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from itertools import product
 
 BLANK = 0
 ACCEPT_STATE = "accept"
@@ -10,6 +18,14 @@ R = "R"
 L = "L"
 S = "S"
 DIRS = (R, L, S)
+DIRS_SET = frozenset(DIRS)  # For validation, DIRS keeps the iteration order
+# Number of characters written to the output at once.
+CHUNK_SIZE = 1 << 16
+# Letter encoding of the single tape machine, see get_encoding.
+Encoding = namedtuple("Encoding", ("underlined", "un_underlined", "double_underlined", "underlined_alphabet",
+                                   "double_underlined_alphabet", "separator"))
+# Translations of previously seen machines.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "turing-translate")
 
 
 def read_two_tape_transitions(path):
@@ -24,25 +40,26 @@ def read_two_tape_transitions(path):
     Returns:
         [transition]: List of two tape Turing Machine transitions.
     """
-    transitions = {}
-    for transition in open(path, "r").read().split("\n"):
-        # Edge case when input file ends with a newline character
-        if transition != "":
-            [cur_state, cur_let1, cur_let2, target_state, out_let1, out_let2, dir1, dir2] = transition.split(" ")
+    transitions = defaultdict(list)
+    with open(path, "r") as tm_file:
+        for transition in tm_file:
+            parts = transition.split()
+            # Skip empty lines, e.g. when input file ends with a newline character
+            if not parts:
+                continue
+            [cur_state, cur_let1, cur_let2, target_state, out_let1, out_let2, dir1, dir2] = parts
             try:
-                cur_let1 = int(cur_let1)
-                cur_let2 = int(cur_let2)
-                out_let1 = int(out_let1)
-                out_let2 = int(out_let2)
+                (cur_let1, cur_let2, out_let1, out_let2) = map(int, (cur_let1, cur_let2, out_let1, out_let2))
             except ValueError:
                 print("Error: Invalid letter in transition! Tape alphabet is natural numbers.")
                 sys.exit()
-            assert dir1 in DIRS
-            assert dir2 in DIRS
-            if (cur_state, cur_let1, cur_let2) not in transitions:
-                transitions[(cur_state, cur_let1, cur_let2)] = []
+            if dir1 not in DIRS_SET or dir2 not in DIRS_SET:
+                print("Error: Invalid direction in transition! Directions are L, R and S.")
+                sys.exit()
             transitions[(cur_state, cur_let1, cur_let2)].append((target_state, out_let1, out_let2, dir1, dir2))
-    return transitions
+    # Drop repeated transitions, which would be translated into identical
+    # single tape transitions.
+    return {key: list(dict.fromkeys(results)) for (key, results) in transitions.items()}
 
 
 def translate_transitions_to_one_tape(TT_transitions):
@@ -77,212 +94,385 @@ def translate_transitions_to_one_tape(TT_transitions):
             a tuple: <state> <let1> <let2> <target_state> <out_let1> <out_let2>
             <dir1> <dir2>
 
-    Returns:
-        [transition]: List of single tape Turing Machine transitions.
+    Yields:
+        transition: Single tape Turing Machine transitions.
     """
     alphabet = get_alphabet(TT_transitions)
-    states = get_states(TT_transitions)
-    max_val = max(alphabet) + 1  # Used for underlining
-    underlined_alphabet = set(max_val + let for let in alphabet)
-    double_underlined_alphabet = set(2*max_val + let for let in alphabet)
-    SEPARATOR = 4 * max_val  # Separating the first and the second tape
-    OT_transitions = []  # One Tape transitions
-
-    # Initialization of the tape.
-    OT_transitions += [(START_STATE, let, state("initializeFirstTape"), underline(let, max_val), R)
-                        for let in alphabet]
-    OT_transitions += [(state("initializeFirstTape"), let, state("initializeFirstTape"), let, R)
-                          for let in alphabet - {BLANK}]
-    OT_transitions += [(state("initializeFirstTape"), BLANK, state("initializeSecondTapeBlank"), SEPARATOR, R)]
-    OT_transitions += [(state("initializeSecondTapeBlank"), BLANK, state("initializeSecondTapeSeparator"), double_underline(BLANK, max_val), R)]
-    OT_transitions += [(state("initializeSecondTapeSeparator"), BLANK, state("goBackToFirstHeadOnSecondTape", org_state=START_STATE), SEPARATOR, L)]
-    OT_transitions += [(state("goBackToFirstHeadOnSecondTape", org_state=org_state), let, state("goBackToFirstHeadOnSecondTape", org_state=org_state), let, L)
-                          for let in alphabet | double_underlined_alphabet
-                          for org_state in states]
-    OT_transitions += [(state("goBackToFirstHeadOnSecondTape", org_state=org_state), SEPARATOR, state("goBackToFirstHeadOnFirstTape", org_state=org_state), SEPARATOR, L)
-                          for org_state in states]
-    OT_transitions += [(state("goBackToFirstHeadOnFirstTape", org_state=org_state), let, state("goBackToFirstHeadOnFirstTape", org_state=org_state), let, L)
-                          for let in alphabet
-                          for org_state in states]
-    OT_transitions += [(state("goBackToFirstHeadOnFirstTape", org_state=org_state), u_let, state("ReadLet2", org_state=org_state, let1=un_underline(u_let, max_val)), u_let, R)
-                          for u_let in underlined_alphabet
-                          for org_state in states]
-
-    # Execute the second head transition.
-    OT_transitions += [(state("ReadLet2", org_state=org_state, let1=let1), let, state("ReadLet2", org_state=org_state, let1=let1), let, R)
-                          for let in alphabet | {SEPARATOR}
-                          for let1 in alphabet
-                          for org_state in states]
-    for org_state in states:
-        for let1 in alphabet:
-            for let2 in alphabet:
-                for (target_state, tlet1, tlet2, dir1, dir2) in TT_transitions.get((org_state, let1, let2), []):
-                    OT_transitions += [(state("ReadLet2", org_state=org_state, let1=let1), double_underline(let2, max_val), state("executeSecondHeadAction", org_state=target_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=dir2), double_underline(let2, max_val), S)]   
-    OT_transitions += [(state("executeSecondHeadAction", org_state=org_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=R), double_underline(let2, max_val), state("executeSecondHeadActionRightCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), tlet2, R)
-                          for tlet1 in alphabet
-                          for tlet2 in alphabet
-                          for let2 in alphabet
-                          for dir1 in DIRS
-                          for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionRightCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), let, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), double_underline(let2, max_val), R)
-                          for tlet1 in alphabet
-                          for let in alphabet
-                          for dir1 in DIRS
-                          for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionRightCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), SEPARATOR, state("executeSecondHeadActionRightTapeExceededWriteNewSeparator", org_state=org_state, tlet1=tlet1, dir1=dir1), double_underline(BLANK, max_val), R)
-                        for tlet1 in alphabet
-                        for dir1 in DIRS
-                        for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionRightTapeExceededWriteNewSeparator", org_state=org_state, tlet1=tlet1, dir1=dir1), BLANK, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), SEPARATOR, L)
-                    for tlet1 in alphabet
-                    for dir1 in DIRS
-                    for org_state in states]
-    OT_transitions += [(state("executeSecondHeadAction", org_state=org_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=S), let2, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), double_underline(tlet2, max_val), L)
-                          for tlet1 in alphabet
-                          for tlet2 in alphabet
-                          for let2 in double_underlined_alphabet
-                          for dir1 in DIRS
-                          for org_state in states]
-    OT_transitions += [(state("executeSecondHeadAction", org_state=org_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=L), let2, state("executeSecondHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), tlet2, L)
-                        for tlet1 in alphabet
-                        for tlet2 in alphabet
-                        for let2 in double_underlined_alphabet
-                        for dir1 in DIRS
-                        for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), let, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), double_underline(let, max_val), L)
-                        for tlet1 in alphabet
-                        for let in alphabet
-                        for dir1 in DIRS
-                        for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1), SEPARATOR, state("executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline", org_state=org_state, tlet1=tlet1, dir1=dir1), SEPARATOR, R)
-                        for tlet1 in alphabet
-                        for dir1 in DIRS
-                        for org_state in states]
-    OT_transitions += [(state("executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline", org_state=org_state, tlet1=tlet1, dir1=dir1), let, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), double_underline(let, max_val), L)
-                        for tlet1 in alphabet
-                        for dir1 in DIRS
-                        for let in alphabet
-                        for org_state in states]
-    
-    # Go back to the first head.
-    OT_transitions += [(state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), let, state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), let, L)
-                    for tlet1 in alphabet
-                    for dir1 in DIRS
-                    for let in alphabet | double_underlined_alphabet | {SEPARATOR}
-                    for org_state in states]
-    OT_transitions += [(state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1), let1, state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=dir1), let1, S)
-                    for tlet1 in alphabet
-                    for dir1 in DIRS
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    
-    # Execute the first head transition.
-    OT_transitions += [(state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=S), let1, state("checkIfTerminalState", org_state=org_state), underline(tlet1, max_val), S)
-                    for tlet1 in alphabet
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=L), let1, state("executeFirstHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1), let1, L)
-                    for tlet1 in alphabet
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1), let1, state("checkIfTerminalState", org_state=org_state), underline(tlet1, max_val), S)
-                    for tlet1 in alphabet
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1), let, state("executeFirstHeadActionLeftCheckIfExceedsTapeTapeNotExceeded", org_state=org_state), underline(let, max_val), R)
-                    for tlet1 in alphabet
-                    for let in alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadActionLeftCheckIfExceedsTapeTapeNotExceeded", org_state=org_state), let1, state("checkIfTerminalState", org_state=org_state), un_underline(let1, max_val), L)
-                    for tlet1 in alphabet
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=R), let1, state("executeFirstHeadActionRightCheckIfExceedsTape", org_state=org_state), tlet1, R)
-                    for tlet1 in alphabet
-                    for let1 in underlined_alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadActionRightCheckIfExceedsTape", org_state=org_state), let, state("checkIfTerminalState", org_state=org_state), underline(let, max_val), S)
-                    for tlet1 in alphabet
-                    for let in alphabet
-                    for org_state in states]
-    OT_transitions += [(state("executeFirstHeadActionRightCheckIfExceedsTape", org_state=org_state), SEPARATOR, state("rewriteSecondTapeWriteSeparator", org_state=org_state), underline(BLANK, max_val), R)
-                    for org_state in states]
-    OT_transitions += [(state("rewriteSecondTapeWriteSeparator", org_state=org_state), let, state("rewriteSecondTape", org_state=org_state, last_letter=let), SEPARATOR, R)
-                       for let in alphabet | double_underlined_alphabet
-                       for org_state in states]
-    OT_transitions += [(state("rewriteSecondTape", org_state=org_state, last_letter=let), let2, state("rewriteSecondTape", org_state=org_state, last_letter=let2), let, R)
-                       for let in alphabet | double_underlined_alphabet
-                       for let2 in alphabet | double_underlined_alphabet | {SEPARATOR}
-                       for org_state in states]
-    OT_transitions += [(state("rewriteSecondTape", org_state=org_state, last_letter=SEPARATOR), BLANK, state("goToFirstHeadCheckTerminal", org_state=org_state), SEPARATOR, L)
-                       for org_state in states]
-    OT_transitions += [(state("goToFirstHeadCheckTerminal", org_state=org_state), let, state("goToFirstHeadCheckTerminal", org_state=org_state), let, L)
-                       for let in alphabet | double_underlined_alphabet | {SEPARATOR}
-                       for org_state in states]
-    OT_transitions += [(state("goToFirstHeadCheckTerminal", org_state=org_state), let, state("checkIfTerminalState", org_state=org_state), let, S)
-                       for let in underlined_alphabet
-                       for org_state in states]
-
-    # Check if terminal state.
-    OT_transitions += [(state("checkIfTerminalState", org_state=org_state), let1, org_state, let1, S)
-                    for let1 in underlined_alphabet
-                    for org_state in (ACCEPT_STATE, REJECT_STATE)]
-    OT_transitions += [(state("checkIfTerminalState", org_state=org_state), let1, state("ReadLet2", org_state=org_state, let1=un_underline(let1, max_val)), let1, R)
-                          for let1 in underlined_alphabet
-                          for org_state in states - {ACCEPT_STATE, REJECT_STATE}]
-    return OT_transitions           
-
-
-def underline(let, max_val):
+    encoding = get_encoding(alphabet)
+    results = get_transition_results(TT_transitions)
+    read_pairs = get_read_pairs(TT_transitions)
+    yield from translate_tape_initialization(alphabet, encoding, read_pairs)
+    yield from translate_second_head_transition(TT_transitions, alphabet, encoding, results, read_pairs)
+    yield from translate_going_back_to_first_head(alphabet, encoding, results)
+    yield from translate_first_head_transition(alphabet, encoding, results)
+    yield from translate_terminal_state_check(encoding, results, read_pairs)
+
+
+def get_encoding(alphabet):
+    """Encodes the underlined and double underlined letters and the separator.
+
+    Underlining sets a bit above all letters of the alphabet, double
+    underlining sets the next one and the separator is the bit above both.
+
+    Args:
+        alphabet (set(int)): Set of all letters used by the TM.
+
+    Returns:
+        Encoding: the underlined value of every letter, the original letter
+            of every underlined value, the double underlined value of every
+            letter, the underlined alphabet, the double underlined alphabet
+            and the separator.
+    """
+    underline_bit = 1 << max(alphabet).bit_length()
+    underlined = {let: underline(let, underline_bit) for let in alphabet}
+    un_underlined = {u_let: un_underline(u_let, underline_bit) for u_let in underlined.values()}
+    double_underlined = {let: double_underline(let, underline_bit) for let in alphabet}
+    underlined_alphabet = set(underlined.values())
+    double_underlined_alphabet = set(double_underlined.values())
+    SEPARATOR = underline_bit << 2  # Separating the first and the second tape
+    return Encoding(underlined, un_underlined, double_underlined, underlined_alphabet, double_underlined_alphabet,
+                    SEPARATOR)
+
+
+def translate_tape_initialization(alphabet, encoding, read_pairs):
+    """Emits the transitions initializing the tape (point 1. and 2. of the
+    algorithm) and going back to the first head.
+
+    Args:
+        alphabet (set(int)): Set of all letters used by the TM.
+        encoding (Encoding): Letter encoding returned by get_encoding().
+        read_pairs (set((str, int))): Pairs returned by get_read_pairs().
+
+    Yields:
+        transition: Single tape Turing Machine transitions.
+    """
+    underlined = encoding.underlined
+    double_underlined = encoding.double_underlined
+    double_underlined_alphabet = encoding.double_underlined_alphabet
+    SEPARATOR = encoding.separator
+    # Going back to the first head only happens once, before the first step,
+    # so the walk does not have to remember the state.
+    yield from ((START_STATE, let, state("initializeFirstTape"), underlined[let], R)
+                for let in alphabet)
+    yield from ((state("initializeFirstTape"), let, state("initializeFirstTape"), let, R)
+                for let in alphabet - {BLANK})
+    yield (state("initializeFirstTape"), BLANK, state("initializeSecondTapeBlank"), SEPARATOR, R)
+    yield (state("initializeSecondTapeBlank"), BLANK, state("initializeSecondTapeSeparator"), double_underlined[BLANK], R)
+    yield (state("initializeSecondTapeSeparator"), BLANK, state("goBackToFirstHeadOnSecondTape"), SEPARATOR, L)
+    yield from ((state("goBackToFirstHeadOnSecondTape"), let, state("goBackToFirstHeadOnSecondTape"), let, L)
+                for let in alphabet | double_underlined_alphabet)
+    yield (state("goBackToFirstHeadOnSecondTape"), SEPARATOR, state("goBackToFirstHeadOnFirstTape"), SEPARATOR, L)
+    yield from ((state("goBackToFirstHeadOnFirstTape"), let, state("goBackToFirstHeadOnFirstTape"), let, L)
+                for let in alphabet)
+    yield from ((state("goBackToFirstHeadOnFirstTape"), underlined[let1], state("ReadLet2", org_state=START_STATE, let1=let1), underlined[let1], R)
+                for (org_state, let1) in read_pairs if org_state == START_STATE)
+
+
+def translate_second_head_transition(TT_transitions, alphabet, encoding, results, read_pairs):
+    """Emits the transitions reading the second letter and executing the
+    second head transition (points 4. - 6. of the algorithm).
+
+    Args:
+        TT_transitions (two_tape_transisions): Dictionary
+            (state, let1, let2) => (t_state, t_let1, t_let2, dir1, dir2)
+        alphabet (set(int)): Set of all letters used by the TM.
+        encoding (Encoding): Letter encoding returned by get_encoding().
+        results (set((str, int, int, str, str))): Results of the TM
+            transitions returned by get_transition_results().
+        read_pairs (set((str, int))): Pairs returned by get_read_pairs().
+
+    Yields:
+        transition: Single tape Turing Machine transitions.
+    """
+    double_underlined = encoding.double_underlined
+    double_underlined_alphabet = encoding.double_underlined_alphabet
+    SEPARATOR = encoding.separator
+    # Only the (state, first letter) pairs of the two tape transitions are
+    # read and only their results are executed.
+    first_tape_alphabet_or_separator = alphabet | {SEPARATOR}
+    for (org_state, let1) in read_pairs:
+        read_state = state("ReadLet2", org_state=org_state, let1=let1)
+        yield from ((read_state, let, read_state, let, R) for let in first_tape_alphabet_or_separator)
+    for ((org_state, let1, let2), TT_transition_results) in TT_transitions.items():
+        if org_state in (ACCEPT_STATE, REJECT_STATE):
+            continue
+        for (target_state, tlet1, tlet2, dir1, dir2) in TT_transition_results:
+            yield (state("ReadLet2", org_state=org_state, let1=let1), double_underlined[let2], state("executeSecondHeadAction", org_state=target_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=dir2), double_underlined[let2], S)
+    for (org_state, tlet1, tlet2, dir1, dir2) in results:
+        execute_state = state("executeSecondHeadAction", org_state=org_state, tlet1=tlet1, tlet2=tlet2, dir1=dir1, dir2=dir2)
+        if dir2 == R:
+            check_state = state("executeSecondHeadActionRightCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1)
+            yield from ((execute_state, double_underlined[let2], check_state, tlet2, R) for let2 in alphabet)
+        elif dir2 == S:
+            go_to_first_head_state = state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1)
+            yield from ((execute_state, let2, go_to_first_head_state, double_underlined[tlet2], L)
+                        for let2 in double_underlined_alphabet)
+        else:
+            check_state = state("executeSecondHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1)
+            yield from ((execute_state, let2, check_state, tlet2, L) for let2 in double_underlined_alphabet)
+    for (org_state, tlet1, dir1) in {(org_state, tlet1, dir1) for (org_state, tlet1, _, dir1, dir2) in results if dir2 == R}:
+        check_state = state("executeSecondHeadActionRightCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        new_separator_state = state("executeSecondHeadActionRightTapeExceededWriteNewSeparator", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        go_to_first_head_state = state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        yield from ((check_state, let, go_to_first_head_state, double_underlined[let], R) for let in alphabet)
+        yield (check_state, SEPARATOR, new_separator_state, double_underlined[BLANK], R)
+        yield (new_separator_state, BLANK, go_to_first_head_state, SEPARATOR, L)
+    for (org_state, tlet1, dir1) in {(org_state, tlet1, dir1) for (org_state, tlet1, _, dir1, dir2) in results if dir2 == L}:
+        check_state = state("executeSecondHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        write_state = state("executeSecondHeadActionLeftTapeExceededWriteDoubleUnderline", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        go_to_first_head_state = state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        yield from ((check_state, let, go_to_first_head_state, double_underlined[let], L) for let in alphabet)
+        yield (check_state, SEPARATOR, write_state, SEPARATOR, R)
+        yield from ((write_state, let, go_to_first_head_state, double_underlined[let], L) for let in alphabet)
+
+
+def translate_going_back_to_first_head(alphabet, encoding, results):
+    """Emits the transitions going back to the first head (point 7. of the
+    algorithm).
+
+    Args:
+        alphabet (set(int)): Set of all letters used by the TM.
+        encoding (Encoding): Letter encoding returned by get_encoding().
+        results (set((str, int, int, str, str))): Results of the TM
+            transitions returned by get_transition_results().
+
+    Yields:
+        transition: Single tape Turing Machine transitions.
+    """
+    underlined_alphabet = encoding.underlined_alphabet
+    double_underlined_alphabet = encoding.double_underlined_alphabet
+    SEPARATOR = encoding.separator
+    second_tape_alphabet_or_separator = alphabet | double_underlined_alphabet | {SEPARATOR}
+    for (org_state, tlet1, dir1) in {(org_state, tlet1, dir1) for (org_state, tlet1, _, dir1, _) in results}:
+        go_to_first_head_state = state("goToFirstHead", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        execute_state = state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        yield from ((go_to_first_head_state, let, go_to_first_head_state, let, L) for let in second_tape_alphabet_or_separator)
+        yield from ((go_to_first_head_state, let1, execute_state, let1, S) for let1 in underlined_alphabet)
+
+
+def translate_first_head_transition(alphabet, encoding, results):
+    """Emits the transitions executing the first head transition (point 8. of
+    the algorithm), including rewriting the second tape when the first tape
+    has to grow.
+
+    Args:
+        alphabet (set(int)): Set of all letters used by the TM.
+        encoding (Encoding): Letter encoding returned by get_encoding().
+        results (set((str, int, int, str, str))): Results of the TM
+            transitions returned by get_transition_results().
+
+    Yields:
+        transition: Single tape Turing Machine transitions.
+    """
+    underlined = encoding.underlined
+    un_underlined = encoding.un_underlined
+    underlined_alphabet = encoding.underlined_alphabet
+    double_underlined_alphabet = encoding.double_underlined_alphabet
+    SEPARATOR = encoding.separator
+    # Letters that can be read while rewriting the second tape.
+    second_tape_alphabet = alphabet | double_underlined_alphabet
+    second_tape_alphabet_or_separator = second_tape_alphabet | {SEPARATOR}
+    for (org_state, tlet1, dir1) in {(org_state, tlet1, dir1) for (org_state, tlet1, _, dir1, _) in results}:
+        execute_state = state("executeFirstHeadAction", org_state=org_state, tlet1=tlet1, dir1=dir1)
+        check_terminal_state = state("checkIfTerminalState", org_state=org_state)
+        if dir1 == S:
+            yield from ((execute_state, let1, check_terminal_state, underlined[tlet1], S) for let1 in underlined_alphabet)
+        elif dir1 == L:
+            left_check_state = state("executeFirstHeadActionLeftCheckIfExceedsTape", org_state=org_state, tlet1=tlet1)
+            not_exceeded_state = state("executeFirstHeadActionLeftCheckIfExceedsTapeTapeNotExceeded", org_state=org_state)
+            yield from ((execute_state, let1, left_check_state, let1, L) for let1 in underlined_alphabet)
+            yield from ((left_check_state, let1, check_terminal_state, underlined[tlet1], S) for let1 in underlined_alphabet)
+            yield from ((left_check_state, let, not_exceeded_state, underlined[let], R) for let in alphabet)
+        else:
+            right_check_state = state("executeFirstHeadActionRightCheckIfExceedsTape", org_state=org_state)
+            yield from ((execute_state, let1, right_check_state, tlet1, R) for let1 in underlined_alphabet)
+    for org_state in {org_state for (org_state, _, _, dir1, _) in results if dir1 == L}:
+        yield from ((state("executeFirstHeadActionLeftCheckIfExceedsTapeTapeNotExceeded", org_state=org_state), let1, state("checkIfTerminalState", org_state=org_state), un_underlined[let1], L)
+                    for let1 in underlined_alphabet)
+    for org_state in {org_state for (org_state, _, _, dir1, _) in results if dir1 == R}:
+        right_check_state = state("executeFirstHeadActionRightCheckIfExceedsTape", org_state=org_state)
+        check_terminal_state = state("checkIfTerminalState", org_state=org_state)
+        write_separator_state = state("rewriteSecondTapeWriteSeparator", org_state=org_state)
+        go_to_first_head_state = state("goToFirstHeadCheckTerminal", org_state=org_state)
+        yield from ((right_check_state, let, check_terminal_state, underlined[let], S) for let in alphabet)
+        yield (right_check_state, SEPARATOR, write_separator_state, underlined[BLANK], R)
+        yield from ((write_separator_state, let, state("rewriteSecondTape", org_state=org_state, last_letter=let), SEPARATOR, R)
+                    for let in second_tape_alphabet)
+        for let in second_tape_alphabet:
+            rewrite_state = state("rewriteSecondTape", org_state=org_state, last_letter=let)
+            yield from ((rewrite_state, let2, state("rewriteSecondTape", org_state=org_state, last_letter=let2), let, R)
+                        for let2 in second_tape_alphabet_or_separator)
+        yield (state("rewriteSecondTape", org_state=org_state, last_letter=SEPARATOR), BLANK, go_to_first_head_state, SEPARATOR, L)
+        yield from ((go_to_first_head_state, let, go_to_first_head_state, let, L) for let in second_tape_alphabet_or_separator)
+        yield from ((go_to_first_head_state, let, check_terminal_state, let, S) for let in underlined_alphabet)
+
+
+def translate_terminal_state_check(encoding, results, read_pairs):
+    """Emits the transitions checking if the new state is terminal (points 9.
+    and 10. of the algorithm).
+
+    Args:
+        encoding (Encoding): Letter encoding returned by get_encoding().
+        results (set((str, int, int, str, str))): Results of the TM
+            transitions returned by get_transition_results().
+        read_pairs (set((str, int))): Pairs returned by get_read_pairs().
+
+    Yields:
+        transition: Single tape Turing Machine transitions.
+    """
+    underlined = encoding.underlined
+    underlined_alphabet = encoding.underlined_alphabet
+    # checkIfTerminalState is only entered in the target states of the two
+    # tape transitions.
+    target_states = {org_state for (org_state, _, _, _, _) in results}
+    yield from ((state("checkIfTerminalState", org_state=org_state), let1, org_state, let1, S)
+                for (let1, org_state) in product(underlined_alphabet, target_states & {ACCEPT_STATE, REJECT_STATE}))
+    yield from ((state("checkIfTerminalState", org_state=org_state), underlined[let1], state("ReadLet2", org_state=org_state, let1=let1), underlined[let1], R)
+                for (org_state, let1) in read_pairs if org_state in target_states)
+
+
+def get_cache_path(path):
+    """Returns the path of the cached translation of a .tm file.
+
+    The name is a hash of both the .tm file and this script, so changing
+    either of them never returns a stale translation.
+
+    Args:
+        path (str): Path to a .tm file with transitions.
+
+    Returns:
+        str: Path of the cache file. It exists only if the file was
+            translated before.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for file_path in (__file__, path):
+        with open(file_path, "rb") as tm_file:
+            content = tm_file.read()
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return os.path.join(CACHE_DIR, digest.hexdigest() + ".tm")
+
+
+def open_cache_file():
+    """Creates a temporary file in CACHE_DIR for a new translation.
+
+    The translation is written under a temporary name and renamed when
+    complete, so an interrupted run never leaves a truncated translation in
+    the cache.
+
+    Returns:
+        file: Temporary file open for writing or None if the cache cannot be
+            written, e.g. CACHE_DIR is read only.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        return tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False)
+    except OSError:
+        return None
+
+
+def discard_cache_file(cache_file):
+    """Closes and removes an unfinished temporary cache file.
+
+    Args:
+        cache_file (file): File returned by open_cache_file().
+    """
+    try:
+        cache_file.close()
+    except OSError:
+        pass  # Flushing the rest of the translation failed, e.g. the disk is full
+    try:
+        os.unlink(cache_file.name)
+    except OSError:
+        pass
+
+
+def format_transitions(OT_transitions):
+    """Formats single tape transitions in the *.tm file format.
+
+    Args:
+        OT_transitions (iterable(transition)): Single tape transitions.
+
+    Yields:
+        str: Chunks of about CHUNK_SIZE characters, one transition per line.
+    """
+    # Every state appears in many transitions, so each one is rendered once.
+    names = {}
+    lines = []
+    size = 0
+    for (state_key, let, t_state_key, t_let, direction) in OT_transitions:
+        try:
+            state_name = names[state_key]
+        except KeyError:
+            state_name = names[state_key] = render_state(state_key)
+        try:
+            t_state_name = names[t_state_key]
+        except KeyError:
+            t_state_name = names[t_state_key] = render_state(t_state_key)
+        line = f"{state_name} {let} {t_state_name} {t_let} {direction}\n"
+        lines.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+            size = 0
+    yield "".join(lines)
+
+
+def underline(let, underline_bit):
     """Returns the underlined value of a letter.
 
     Args:
         let (int): Tape letter.
-        max_val (int): Maximum value used by the TM +1
+        underline_bit (int): Power of two greater than all letters used by
+            the TM.
 
     Returns:
         int: Encoded underlined letter.
     """
-    return max_val + let
+    return let | underline_bit
 
 
-def double_underline(let, max_val):
+def double_underline(let, underline_bit):
     """Returns the double underlined value of a letter.
 
     Args:
         let (int): Tape letter.
-        max_val (int): Maximum value used by the TM +1
+        underline_bit (int): Power of two greater than all letters used by
+            the TM.
 
     Returns:
         int: Encoded double underlined letter.
     """
-    return 2 * max_val + let
+    return let | underline_bit << 1
 
 
-def un_underline(let, max_val):
+def un_underline(let, underline_bit):
     """Decodes value of the original letter from its underlined value.
 
     Args:
         let (int): Underlined tape letter.
-        max_val (int): Maximum value used by the TM +1
+        underline_bit (int): Power of two greater than all letters used by
+            the TM.
 
     Returns:
         int: Decoded value of the original letter.
     """
-    return let - max_val
+    return let ^ underline_bit
 
 
-def un_double_underline(let, max_val):
+def un_double_underline(let, underline_bit):
     """Decodes value of the original letter from its double underlined value.
 
     Args:
         let (int): Double underlined tape letter.
-        max_val (int): Maximum value used by the TM +1
+        underline_bit (int): Power of two greater than all letters used by
+            the TM.
 
     Returns:
         int: Decoded value of the original letter.
     """
-    return let - 2 * max_val
+    return let ^ underline_bit << 1
 
 
 def get_alphabet(TT_transitions):
@@ -297,30 +487,52 @@ def get_alphabet(TT_transitions):
     """
     alphabet = {BLANK}
     for ((_, cur_let1, cur_let2), TT_transition_results) in TT_transitions.items():
-        alphabet |= {cur_let1, cur_let2}
+        alphabet.add(cur_let1)
+        alphabet.add(cur_let2)
         for (_, out_let1, out_let2, _, _) in TT_transition_results:
-            alphabet |= {out_let1, out_let2}
+            alphabet.add(out_let1)
+            alphabet.add(out_let2)
     return alphabet
 
 
-def get_states(TT_transitions):
-    """Get all states used by the TM.
+def get_transition_results(TT_transitions):
+    """Get all results of the TM transitions which can be executed, i.e.
+    the ones leaving non-terminal states.
+
+    Args:
+        TT_transitions (two_tape_transisions): Dictionary
+            (state, let1, let2) => (t_state, t_let1, t_let2, dir1, dir2)
+
+    Returns:
+        set((str, int, int, str, str)): Set of all
+            (t_state, t_let1, t_let2, dir1, dir2) of the TM.
+    """
+    return {TT_transition_result for ((org_state, _, _), TT_transition_results) in TT_transitions.items()
+            if org_state not in (ACCEPT_STATE, REJECT_STATE) for TT_transition_result in TT_transition_results}
+
+
+def get_read_pairs(TT_transitions):
+    """Get the (state, let1) pairs of non-terminal states for which the TM
+    has a transition.
 
     Args:
         TT_transitions (two_tape_transisions): Dictionary
             (state, let1, let2) => (t_state, t_let1, t_let2, dir1, dir2)
 
     Returns:
-        set(str): Set of all states used by the TM.
+        set((str, int)): Set of all (state, let1) pairs the second letter is
+            read for.
     """
-    states = {START_STATE, ACCEPT_STATE, REJECT_STATE}
-    for ((org_state, _, _), TT_transition_results) in TT_transitions.items():
-        states |= {org_state}
-        for (t_state, _, _, _, _) in TT_transition_results:
-            states |= {t_state}
-    return states
+    return {(org_state, let1) for (org_state, let1, _) in TT_transitions
+            if org_state not in (ACCEPT_STATE, REJECT_STATE)}
 
 
+# Names of the keyword arguments of every state encoded by state(), e.g.
+# "ReadLet2" => ("org_state", "let1").
+state_fields = {}
+
+
+@lru_cache(maxsize=None)
 def state(name, **kwards):
     """Encodes the TM state.
 
@@ -328,21 +540,66 @@ def state(name, **kwards):
         name (str): State name
 
     Returns:
-        str: Encoded state.
+        tuple: Encoded state. Converted to a string by render_state.
+    """
+    if name not in state_fields:
+        state_fields[name] = tuple(kwards)
+    return (name, *kwards.values())
+
+
+def render_state(encoded_state):
+    """Converts an encoded state to its name in the *.tm file format.
+
+    Args:
+        encoded_state (str | tuple): State of the two tape TM or a state
+            encoded by state().
+
+    Returns:
+        str: State name, e.g. "ReadLet2|org_state:start|let1:0".
     """
-    out = f"{name}"
-    for key, val in kwards.items():
-        out += f"|{key}:{val}"
-    return out
+    if isinstance(encoded_state, str):
+        return encoded_state
+    (name, *values) = encoded_state
+    return name + "".join(f"|{key}:{val}" for key, val in zip(state_fields[name], values))
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("python3 translate <path_to_a_two_tape_turing_machine>")
+    use_cache = "--no-cache" not in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--no-cache"]
+    if len(args) != 1:
+        print("python3 translate [--no-cache] <path_to_a_two_tape_turing_machine>")
+        print("Translations are cached in " + CACHE_DIR + ", --no-cache skips the cache.")
         sys.exit()
 
-    path_to_turing_machine = sys.argv[1]
+    # The translation allocates millions of small tuples and no reference
+    # cycles, so the cyclic garbage collector would only slow it down.
+    gc.disable()
+    path_to_turing_machine = args[0]
+    if use_cache:
+        cache_path = get_cache_path(path_to_turing_machine)
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as cache_file:
+                shutil.copyfileobj(cache_file, sys.stdout, CHUNK_SIZE)
+            sys.exit()
     TT_transitions = read_two_tape_transitions(path_to_turing_machine)
-    OT_transitions = translate_transitions_to_one_tape(TT_transitions)
-    for (state, let, t_state, t_let, direction) in OT_transitions:
-        print(f"{state} {let} {t_state} {t_let} {direction}")
+    # If the cache cannot be written, the translation is only printed.
+    cache_file = open_cache_file() if use_cache else None
+    try:
+        for chunk in format_transitions(translate_transitions_to_one_tape(TT_transitions)):
+            sys.stdout.write(chunk)
+            if cache_file is not None:
+                try:
+                    cache_file.write(chunk)
+                except OSError:
+                    discard_cache_file(cache_file)
+                    cache_file = None
+    except BaseException:
+        if cache_file is not None:
+            discard_cache_file(cache_file)
+        raise
+    if cache_file is not None:
+        try:
+            cache_file.close()
+            os.replace(cache_file.name, cache_path)
+        except OSError:
+            discard_cache_file(cache_file)